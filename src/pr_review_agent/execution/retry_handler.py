@@ -1,8 +1,14 @@
 """Intelligent retry handler with exponential backoff and strategy adaptation."""
 
+import functools
+import math
+import random
+import threading
 import time
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from enum import Enum
 from typing import TypeVar
 
@@ -19,16 +25,16 @@ class FailureType(Enum):
     TIMEOUT = "timeout"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RetryContext:
     """Context for tracking retry attempts and failures."""
 
     attempt: int = 0
     max_attempts: int = 3
-    failures: list[FailureType] = field(default_factory=list)
+    failures: frozenset[FailureType] = frozenset()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RetryStrategy:
     """Adapted strategy based on failures."""
 
@@ -76,9 +82,181 @@ class RetryExhaustedError(Exception):
         self.attempts = attempts
 
 
-def get_backoff_seconds(attempt: int) -> float:
-    """Exponential backoff: 1s, 2s, 4s, 8s... capped at 30s."""
-    return min(2**attempt, 30)
+class CircuitOpenError(Exception):
+    """Raised by CircuitBreaker.before_call when a call is refused.
+
+    retry_with_adaptation re-raises it as RetryExhaustedError (chained via
+    __cause__) so callers keep the records of the attempts that did run.
+    """
+
+
+class CircuitState(Enum):
+    """State of a CircuitBreaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Fail fast once a model keeps failing, instead of burning every retry.
+
+    After ``failure_threshold`` consecutive upstream failures (rate limits, 5xx,
+    connection errors and timeouts; see ``_is_upstream_failure``) the circuit
+    opens and calls are refused for ``recovery_timeout`` seconds. After that a
+    single probe call is let through (half-open) while other callers are still
+    refused: success closes the circuit, another failure re-opens it for a fresh
+    timeout, and an inconclusive outcome (see ``release``) frees the probe slot.
+    Breakers are shared across threads, so every state change holds a lock.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> CircuitState:
+        """Current state; the caller must hold ``_lock``."""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if self._clock() - self._opened_at >= self.recovery_timeout:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError if calls are currently refused."""
+        with self._lock:
+            state = self._state()
+            if state is CircuitState.OPEN:
+                remaining = self.recovery_timeout - (self._clock() - self._opened_at)
+                raise CircuitOpenError(
+                    f"Circuit open after {self._failures} consecutive failures; "
+                    f"retry in {remaining:.0f}s"
+                )
+            if state is CircuitState.HALF_OPEN:
+                if self._probe_in_flight:
+                    raise CircuitOpenError(
+                        "Circuit half-open; a probe call is already in flight"
+                    )
+                self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if (
+                self._state() is CircuitState.HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                self._opened_at = self._clock()
+            self._probe_in_flight = False
+
+    def release(self) -> None:
+        """End a call that neither succeeded nor failed upstream.
+
+        A rejected response or a non-retryable error says nothing about the
+        model's health, so it frees the half-open probe slot without changing
+        the circuit state. Safe to call after record_success/record_failure.
+        """
+        with self._lock:
+            self._probe_in_flight = False
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(model: str) -> CircuitBreaker:
+    """Return the process-wide circuit breaker for a model."""
+    with _breakers_lock:
+        breaker = _breakers.get(model)
+        if breaker is None:
+            breaker = _breakers[model] = CircuitBreaker()
+        return breaker
+
+
+def reset_circuit_breakers() -> None:
+    """Forget all breaker state (for tests and long-running processes)."""
+    with _breakers_lock:
+        _breakers.clear()
+
+
+def _is_upstream_failure(error: anthropic.APIError) -> bool:
+    """Whether an error reflects the model's health, and so counts for its breaker.
+
+    Connection errors (including timeouts), 5xx responses and rate limits do.
+    Other 4xx responses are the caller's own mistakes and must not open the
+    circuit for everyone else using the model.
+    """
+    if isinstance(error, anthropic.APIConnectionError):
+        return True
+    if isinstance(error, anthropic.APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    return False
+
+
+def get_backoff_seconds(
+    attempt: int,
+    cap: float = 30,
+    base: float = 1,
+    rng: Callable[[], float] = random.random,
+) -> float:
+    """Exponential backoff with +/-20% jitter: ~1s, 2s, 4s, 8s... capped at 30s.
+
+    The jitter spreads out retries from concurrent reviews that hit the same
+    rate limit, so they don't all come back at the same instant.
+    """
+    return min(base * (1 << attempt), cap) * (0.8 + 0.4 * rng())
+
+
+def get_retry_after_seconds(
+    error: anthropic.APIStatusError, cap: float = 60
+) -> float | None:
+    """Read the server's Retry-After hint (delta-seconds or HTTP-date), if any.
+
+    Returns None when the header is missing or unusable (including inf/nan),
+    so the caller falls back to its own backoff. Valid hints are clamped to
+    [0, cap] so a hostile or buggy header can't stall the review.
+    """
+    try:
+        header = error.response.headers.get("retry-after")
+    except AttributeError:
+        return None
+    if not isinstance(header, str):
+        return None
+    try:
+        seconds = float(header)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(header)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            # RFC 5322 "-0000" dates come back naive; they are still UTC
+            retry_at = retry_at.replace(tzinfo=UTC)
+        seconds = (retry_at - datetime.now(UTC)).total_seconds()
+    if not math.isfinite(seconds):
+        return None
+    return min(max(0.0, seconds), cap)
 
 
 def _describe_strategy(strategy: RetryStrategy, context: RetryContext) -> str | None:
@@ -97,28 +275,61 @@ def _describe_strategy(strategy: RetryStrategy, context: RetryContext) -> str |
     return ", ".join(parts) if parts else None
 
 
+def _haiku_if_sonnet(model: str) -> str:
+    return "claude-haiku-4-5-20251001" if "sonnet" in model else model
+
+
+def _unchanged(strategy: RetryStrategy) -> RetryStrategy:
+    return strategy
+
+
+# How each kind of failure adjusts the next attempt. Each mutator touches its
+# own fields, so applying them in any order gives the same strategy. Failure
+# types without an entry (API errors, timeouts) retry unchanged.
+_MUTATORS: dict[FailureType, Callable[[RetryStrategy], RetryStrategy]] = {
+    # Diff too big - summarize it
+    FailureType.CONTEXT_TOO_LONG: lambda s: replace(s, summarize_diff=True, chunk_files=True),
+    # Bad response - try with higher temp for variety
+    FailureType.LOW_QUALITY_RESPONSE: lambda s: replace(s, temperature=0.3),
+    # Rate limited - fall back to smaller model
+    FailureType.RATE_LIMIT: lambda s: replace(s, model=_haiku_if_sonnet(s.model)),
+}
+
+
+_BASE_STRATEGIES: dict[str, RetryStrategy] = {}
+
+
+def _base_strategy(model: str) -> RetryStrategy:
+    """The unadapted strategy for a model, built once per model."""
+    strategy = _BASE_STRATEGIES.get(model)
+    if strategy is None:
+        strategy = _BASE_STRATEGIES[model] = RetryStrategy(
+            model=model,
+            max_tokens=4096,
+            temperature=0.0,
+        )
+    return strategy
+
+
 def adapt_strategy(context: RetryContext, base_model: str) -> RetryStrategy:
     """Adapt strategy based on what failed."""
-    strategy = RetryStrategy(
-        model=base_model,
-        max_tokens=4096,
-        temperature=0.0,
-    )
+    if not context.failures:
+        # First attempt, nothing to adapt: skip building the cache key
+        return _base_strategy(base_model)
+    return _adapt_cached(context.failures, base_model)
 
-    if FailureType.CONTEXT_TOO_LONG in context.failures:
-        # Diff too big - summarize it
-        strategy.summarize_diff = True
-        strategy.chunk_files = True
 
-    if FailureType.LOW_QUALITY_RESPONSE in context.failures:
-        # Bad response - try with higher temp for variety
-        strategy.temperature = 0.3
-
-    if FailureType.RATE_LIMIT in context.failures:
-        # Rate limited - fall back to smaller model
-        if "sonnet" in strategy.model:
-            strategy.model = "claude-haiku-4-5-20251001"
+@functools.lru_cache(maxsize=128)
+def _adapt_cached(failures: frozenset[FailureType], base_model: str) -> RetryStrategy:
+    """Build the strategy for a set of failures, memoized per (failures, model).
 
+    Only which failures happened matters, not the attempt number, so the key
+    is just the context's failure set. Strategies are frozen, so handing the
+    same instance to every caller is safe.
+    """
+    strategy = _base_strategy(base_model)
+    for failure in failures:
+        strategy = _MUTATORS.get(failure, _unchanged)(strategy)
     return strategy
 
 
@@ -130,6 +341,8 @@ def retry_with_adaptation(
     base_model: str,
     max_attempts: int = 3,
     validator: Callable[[T], bool] | None = None,
+    *,
+    sleep: Callable[[float], object] = time.sleep,
 ) -> RetryResult:
     """Execute operation with intelligent retries.
 
@@ -138,21 +351,45 @@ def retry_with_adaptation(
         base_model: Starting model to use
         max_attempts: Maximum retry attempts
         validator: Optional function to validate response quality
+        sleep: Called with the delay between attempts (injectable for tests)
 
     Returns:
         RetryResult with the operation result and attempt records.
 
     Raises:
-        RetryExhaustedError: If all retries exhausted (includes attempt records).
+        RetryExhaustedError: If all retries exhausted, or the model's circuit
+            breaker is open (includes the records of attempts that ran).
     """
     context = RetryContext(max_attempts=max_attempts)
     last_error = None
     attempt_records: list[AttemptRecord] = []
+    backoff = None
 
     while context.attempt < context.max_attempts:
         strategy = adapt_strategy(context, base_model)
         strategy_desc = _describe_strategy(strategy, context)
+        breaker = get_circuit_breaker(strategy.model)
+
+        # Check the breaker before backing off, so an open circuit fails fast
+        try:
+            breaker.before_call()
+        except CircuitOpenError as e:
+            raise RetryExhaustedError(
+                f"Circuit open for {strategy.model} after {len(attempt_records)} "
+                f"attempt(s): {e}",
+                attempts=attempt_records,
+            ) from e
+
+        if backoff is not None:
+            print(
+                f"Retry {context.attempt}/{context.max_attempts} "
+                f"after {backoff:.1f}s ({last_error})"
+            )
+            sleep(backoff)
+            backoff = None
+
         start_time = time.monotonic()
+        retry_after = None
 
         try:
             result = operation(strategy)
@@ -164,11 +401,14 @@ def retry_with_adaptation(
                     attempt_number=context.attempt + 1,
                     model_used=strategy.model,
                     latency_ms=elapsed_ms,
-                    failure_type="low_quality_response",
+                    failure_type=FailureType.LOW_QUALITY_RESPONSE.value,
                     strategy_applied=strategy_desc,
                 ))
-                context.failures.append(FailureType.LOW_QUALITY_RESPONSE)
-                context.attempt += 1
+                context = replace(
+                    context,
+                    attempt=context.attempt + 1,
+                    failures=context.failures | {FailureType.LOW_QUALITY_RESPONSE},
+                )
                 continue
 
             elapsed_ms = int((time.monotonic() - start_time) * 1000)
@@ -180,18 +420,19 @@ def retry_with_adaptation(
                 strategy_applied=strategy_desc,
             ))
 
+            breaker.record_success()
             return RetryResult(result=result, attempts=attempt_records)
 
-        except anthropic.RateLimitError:
-            context.failures.append(FailureType.RATE_LIMIT)
+        except anthropic.RateLimitError as e:
             last_error = "Rate limit exceeded"
-            failure = "rate_limit"
+            failure = FailureType.RATE_LIMIT
+            retry_after = get_retry_after_seconds(e)
+            breaker.record_failure()
 
         except anthropic.BadRequestError as e:
             if "context length" in str(e).lower():
-                context.failures.append(FailureType.CONTEXT_TOO_LONG)
                 last_error = "Context too long"
-                failure = "context_too_long"
+                failure = FailureType.CONTEXT_TOO_LONG
             else:
                 raise
 
@@ -200,28 +441,31 @@ def retry_with_adaptation(
             raise
 
         except anthropic.APIError as e:
-            context.failures.append(FailureType.API_ERROR)
             last_error = str(e)
-            failure = "api_error"
+            failure = FailureType.API_ERROR
+            if _is_upstream_failure(e):
+                breaker.record_failure()
+
+        finally:
+            # Free a half-open probe slot if the call was inconclusive
+            breaker.release()
 
         elapsed_ms = int((time.monotonic() - start_time) * 1000)
         attempt_records.append(AttemptRecord(
             attempt_number=context.attempt + 1,
             model_used=strategy.model,
             latency_ms=elapsed_ms,
-            failure_type=failure,
+            failure_type=failure.value,
             strategy_applied=strategy_desc,
         ))
 
-        context.attempt += 1
+        context = replace(
+            context, attempt=context.attempt + 1, failures=context.failures | {failure}
+        )
 
-        if context.attempt < context.max_attempts:
-            backoff = get_backoff_seconds(context.attempt)
-            print(
-                f"Retry {context.attempt}/{context.max_attempts} "
-                f"after {backoff}s ({last_error})"
-            )
-            time.sleep(backoff)
+        # Prefer the server's Retry-After over our own guess; slept at the
+        # top of the next attempt, once the breaker has allowed it
+        backoff = retry_after if retry_after is not None else get_backoff_seconds(context.attempt)
 
     raise RetryExhaustedError(
         f"All {max_attempts} attempts failed. Last error: {last_error}",
@@ -6,6 +6,17 @@ to GitHub, redacting any matches to prevent credential leakage.
 
 import re
 from dataclasses import dataclass, field
+from types import ModuleType
+from typing import Any
+
+# google-re2 is optional (the "re2" extra). When installed, the secret patterns
+# run on RE2's linear-time automaton, so adversarial input (long base64 blobs,
+# unterminated PEM blocks) cannot trigger backtracking blowups. The patterns
+# are plain regular expressions, so the stdlib engine is a drop-in fallback.
+try:
+    import re2 as _secret_re
+except ImportError:
+    _secret_re = re
 
 # Patterns that indicate placeholder/example values (not real secrets)
 # Only match when the value IS a placeholder, not when it merely contains
@@ -16,69 +27,75 @@ _PLACEHOLDER_PATTERNS = re.compile(
     re.IGNORECASE,
 )
 
-# Secret detection patterns: (name, regex, description)
-_SECRET_PATTERNS: list[tuple[str, re.Pattern[str], str]] = [
+# Secret detection patterns: (name, regex source, description).
+# Case-insensitive patterns scope the flag inline with (?i:...), so the sources
+# compile identically under re and RE2.
+_SECRET_PATTERNS: tuple[tuple[str, str, str], ...] = (
     (
         "aws_access_key",
-        re.compile(r"AKIA[0-9A-Z]{16}"),
+        r"AKIA[0-9A-Z]{16}",
         "AWS Access Key ID",
     ),
     (
         "aws_secret_key",
-        re.compile(r"(?:aws_secret|secret_key|secret_access)\s*[=:]\s*['\"]?([A-Za-z0-9/+=]{40})['\"]?"),
+        r"(?:aws_secret|secret_key|secret_access)\s*[=:]\s*['\"]?[A-Za-z0-9/+=]{40}['\"]?",
         "AWS Secret Access Key",
     ),
     (
         "github_token",
-        re.compile(r"(?:ghp|gho|ghu|ghs|ghr|github_pat)_[A-Za-z0-9_]{30,}"),
+        r"(?:ghp|gho|ghu|ghs|ghr|github_pat)_[A-Za-z0-9_]{30,}",
         "GitHub Personal Access Token",
     ),
     (
         "jwt_token",
-        re.compile(r"eyJ[A-Za-z0-9_-]{10,}\.eyJ[A-Za-z0-9_-]{10,}\.[A-Za-z0-9_-]{10,}"),
+        r"eyJ[A-Za-z0-9_-]{10,}\.eyJ[A-Za-z0-9_-]{10,}\.[A-Za-z0-9_-]{10,}",
         "JWT Token",
     ),
     (
         "private_key",
-        re.compile(
-            r"-----BEGIN\s+(?:RSA\s+|EC\s+|DSA\s+|OPENSSH\s+)?PRIVATE\s+KEY-----"
-            r"[\s\S]*?"
-            r"-----END\s+(?:RSA\s+|EC\s+|DSA\s+|OPENSSH\s+)?PRIVATE\s+KEY-----",
-        ),
+        r"-----BEGIN\s+(?:RSA\s+|EC\s+|DSA\s+|OPENSSH\s+)?PRIVATE\s+KEY-----"
+        r"[\s\S]*?"
+        r"-----END\s+(?:RSA\s+|EC\s+|DSA\s+|OPENSSH\s+)?PRIVATE\s+KEY-----",
         "Private Key (PEM)",
     ),
     (
         "api_key",
-        re.compile(
-            r"(?:api[_-]?key|apikey|secret[_-]?key)\s*[=:]\s*['\"]?"
-            r"([A-Za-z0-9_\-]{20,})['\"]?",
-            re.IGNORECASE,
-        ),
+        r"(?i:(?:api[_-]?key|apikey|secret[_-]?key)\s*[=:]\s*['\"]?"
+        r"[A-Za-z0-9_\-]{20,}['\"]?)",
         "Generic API Key",
     ),
     (
         "database_url",
-        re.compile(
-            r"(?:postgres(?:ql)?|mysql|mongodb(?:\+srv)?|redis)://"
-            r"[^:]+:[^@]+@[^\s'\"]+",
-            re.IGNORECASE,
-        ),
+        r"(?i:(?:postgres(?:ql)?|mysql|mongodb(?:\+srv)?|redis)://"
+        r"[^:]+:[^@]+@[^\s'\"]+)",
         "Database Connection URL",
     ),
     (
         "slack_webhook",
-        re.compile(r"https://hooks\.slack\.com/services/T[A-Z0-9]+/B[A-Z0-9]+/[A-Za-z0-9]+"),
+        r"https://hooks\.slack\.com/services/T[A-Z0-9]+/B[A-Z0-9]+/[A-Za-z0-9]+",
         "Slack Webhook URL",
     ),
     (
         "password",
-        re.compile(
-            r"(?:password|passwd|pwd)\s*[=:]\s*['\"]([^'\"]{8,})['\"]",
-            re.IGNORECASE,
-        ),
+        r"(?i:(?:password|passwd|pwd)\s*[=:]\s*['\"][^'\"]{8,}['\"])",
         "Password Assignment",
     ),
-]
+)
+
+def _compile_patterns(engine: ModuleType) -> tuple[tuple[str, Any, str], ...]:
+    """Compile the secret patterns with a regex module (re or re2)."""
+    return tuple(
+        (name, engine.compile(pattern), description)
+        for name, pattern, description in _SECRET_PATTERNS
+    )
+
+
+# Each pattern is scanned on its own. A single alternation would let the first
+# listed pattern win at a position, e.g. aws_secret_key's 40-char value would
+# shadow api_key's longer match and leave the tail of the secret exposed.
+# Each scan is one finditer pass: RE2 encodes the text once per call, so a
+# search(text, pos) loop would re-encode it for every match.
+_COMPILED_PATTERNS = _compile_patterns(_secret_re)
 
 
 @dataclass
@@ -113,12 +130,13 @@ def _is_placeholder(text: str) -> bool:
 def scan_for_secrets(text: str) -> list[SecretMatch]:
     """Scan text for secret patterns.
 
-    Returns list of SecretMatch objects for each detected secret.
-    Filters out obvious placeholders and example values.
+    Returns list of SecretMatch objects for each detected secret, ordered by
+    position. Matches from different patterns may overlap. Filters out obvious
+    placeholders and example values.
     """
     matches: list[SecretMatch] = []
 
-    for name, pattern, description in _SECRET_PATTERNS:
+    for name, pattern, description in _COMPILED_PATTERNS:
         for match in pattern.finditer(text):
             matched_text = match.group(0)
 
@@ -134,25 +152,35 @@ def scan_for_secrets(text: str) -> list[SecretMatch]:
                 matched_text=matched_text,
             ))
 
+    matches.sort(key=lambda m: (m.start, -m.end))
     return matches
 
 
 def redact_secrets(text: str) -> RedactionResult:
     """Scan text and redact any detected secrets.
 
-    Replaces secrets with [REDACTED] while preserving context.
-    Never fails - returns original text if scanning encounters errors.
+    Replaces secrets with [REDACTED] while preserving context. Overlapping
+    matches are merged first, so each secret is redacted in full.
     """
     matches = scan_for_secrets(text)
 
     if not matches:
         return RedactionResult(redacted_text=text)
 
-    # Sort matches by position (reverse) to replace from end to start
-    sorted_matches = sorted(matches, key=lambda m: m.start, reverse=True)
-
-    redacted = text
-    for match in sorted_matches:
-        redacted = redacted[: match.start] + "[REDACTED]" + redacted[match.end :]
-
-    return RedactionResult(redacted_text=redacted, matches=matches)
+    # Matches are sorted by start; merge overlapping spans
+    spans: list[list[int]] = []
+    for match in matches:
+        if spans and match.start < spans[-1][1]:
+            spans[-1][1] = max(spans[-1][1], match.end)
+        else:
+            spans.append([match.start, match.end])
+
+    parts: list[str] = []
+    last_end = 0
+    for start, end in spans:
+        parts.append(text[last_end:start])
+        parts.append("[REDACTED]")
+        last_end = end
+    parts.append(text[last_end:])
+
+    return RedactionResult(redacted_text="".join(parts), matches=matches)
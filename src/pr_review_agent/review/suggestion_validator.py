@@ -1,6 +1,7 @@
 """Validate code suggestions before posting to GitHub."""
 
 import ast
+import functools
 
 
 def validate_suggestion(suggestion: str | None, filename: str) -> str | None:
@@ -20,12 +21,23 @@ def validate_suggestion(suggestion: str | None, filename: str) -> str | None:
     if not suggestion.strip():
         return None
 
+    return _validate_cached(suggestion, _is_python_file(filename))
+
+
+@functools.lru_cache(maxsize=1024)
+def _validate_cached(suggestion: str, is_python: bool) -> str | None:
+    """Run the indentation and syntax checks, memoized per suggestion.
+
+    Keyed on whether the target is a Python file rather than the full
+    filename, so the same snippet suggested for different files (common for
+    boilerplate fixes) only pays for ast.parse once.
+    """
     # Check for mixed indentation (tabs and spaces)
     if _has_mixed_indentation(suggestion):
         return None
 
     # For Python files, validate syntax
-    if _is_python_file(filename) and not _is_valid_python(suggestion):
+    if is_python and not _is_valid_python(suggestion):
         return None
 
     return suggestion
@@ -1,9 +1,26 @@
 """Shared test fixtures and configuration."""
 
-import pytest
 from dataclasses import dataclass
 from unittest.mock import MagicMock
 
+import pytest
+
+# Eagerly import the heavier modules under test so each (xdist) worker pays
+# their import cost, and the anthropic/supabase chains behind them, once
+# during startup rather than in whichever test happens to touch them first.
+import pr_review_agent.analysis.pre_analyzer  # noqa: F401
+import pr_review_agent.escalation.webhook  # noqa: F401
+import pr_review_agent.execution.retry_handler  # noqa: F401
+import pr_review_agent.mcp.tools  # noqa: F401
+import pr_review_agent.metrics.supabase_logger  # noqa: F401
+import pr_review_agent.metrics.token_tracker  # noqa: F401
+import pr_review_agent.review.model_selector  # noqa: F401
+import pr_review_agent.review.sanitizer  # noqa: F401
+from pr_review_agent.config import Config, LLMConfig
+from pr_review_agent.escalation.webhook import EscalationPayload
+from pr_review_agent.execution.retry_handler import reset_circuit_breakers
+from pr_review_agent.github_client import PRData
+
 
 @dataclass
 class MockPRData:
@@ -41,6 +58,14 @@ class MockConfig:
     simple_model: str = "claude-haiku-4-5-20251001"
 
 
+@pytest.fixture(autouse=True)
+def _reset_circuit_breakers():
+    """Keep the process-wide LLM circuit breakers from leaking between tests."""
+    reset_circuit_breakers()
+    yield
+    reset_circuit_breakers()
+
+
 @pytest.fixture
 def mock_pr():
     """Default mock PR."""
@@ -53,6 +78,88 @@ def mock_config():
     return MockConfig()
 
 
+@pytest.fixture(scope="session")
+def base_config():
+    """Config with haiku/sonnet models and a 50-line simple threshold.
+
+    Session-scoped: tests only read from it, so build it once.
+    """
+    return Config(llm=LLMConfig(
+        simple_model="claude-haiku-4-20250514",
+        default_model="claude-sonnet-4-20250514",
+        simple_threshold_lines=50,
+    ))
+
+
+@pytest.fixture(scope="session")
+def pr_factory():
+    """Factory for PRData with every field but the line counts defaulted.
+
+    Call as ``pr_factory(lines_added=20, lines_removed=10)``. Each call gets
+    its own ``files_changed`` list, so tests can mutate it freely.
+    """
+
+    def make_pr(**overrides) -> PRData:
+        fields = {
+            "owner": "test",
+            "repo": "repo",
+            "number": 1,
+            "title": "Test",
+            "author": "user",
+            "description": "",
+            "diff": "",
+            "files_changed": [],
+            "base_branch": "main",
+            "head_branch": "feature",
+            "url": "",
+        }
+        return PRData(**(fields | overrides))
+
+    return make_pr
+
+
+@pytest.fixture(scope="session")
+def base_pr() -> PRData:
+    """A fully populated PRData for tests that only read from it."""
+    return PRData(
+        owner="testorg",
+        repo="testrepo",
+        number=42,
+        title="Fix auth bug",
+        author="dev1",
+        description="Fixes login issue",
+        diff="+ fix",
+        files_changed=["src/auth.py"],
+        lines_added=10,
+        lines_removed=5,
+        base_branch="main",
+        head_branch="fix/auth",
+        url="https://github.com/testorg/testrepo/pull/42",
+    )
+
+
+@pytest.fixture(scope="session")
+def payload_factory():
+    """Factory for EscalationPayload; override only the fields a test checks."""
+
+    def _factory(**overrides) -> EscalationPayload:
+        fields = dict(
+            pr_url="url",
+            pr_title="PR",
+            pr_author="dev",
+            repo="org/repo",
+            pr_number=1,
+            confidence_score=0.3,
+            confidence_level="low",
+            review_summary="Summary",
+            escalation_reason="Reason",
+        )
+        fields.update(overrides)
+        return EscalationPayload(**fields)
+
+    return _factory
+
+
 @pytest.fixture
 def mock_anthropic_success():
     """Mock successful Anthropic API response."""
@@ -1,7 +1,7 @@
 """Integration tests for the full adaptive review flow."""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, MagicMock
 from dataclasses import dataclass
 
 from pr_review_agent.analysis.pre_analyzer import analyze_pr, PRType, RiskLevel
@@ -127,8 +127,7 @@ class TestRetryIntegration:
         assert retry_result.result["result"] == "success"
         assert call_count == 1
 
-    @patch("time.sleep")
-    def test_retry_adapts_on_failure(self, mock_sleep):
+    def test_retry_adapts_on_failure(self):
         """Strategy should adapt on failure."""
         import anthropic
 
@@ -147,6 +146,7 @@ class TestRetryIntegration:
             operation=operation,
             base_model="claude-sonnet-4-20250514",
             max_attempts=3,
+            sleep=lambda _: None,
         )
 
         assert retry_result.result == "success"
@@ -1,8 +1,10 @@
 """Tests for MCP tools."""
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
+import pytest_asyncio
 
 from pr_review_agent.mcp.tools import (
     _check_pr_lint,
@@ -14,13 +16,20 @@ from pr_review_agent.mcp.tools import (
     list_tools,
 )
 
+# Plain attribute bags for gate results and PR data that are only read.
+_PASS = SimpleNamespace(passed=True, reason=None)
 
-@pytest.mark.asyncio
-async def test_list_tools_returns_all():
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def tools_list():
+    """Tool definitions from a single list_tools() call."""
+    return await list_tools()
+
+
+def test_list_tools_returns_all(tools_list):
     """list_tools returns all 5 tools."""
-    tools = await list_tools()
-    assert len(tools) == 5
-    names = {t.name for t in tools}
+    assert len(tools_list) == 5
+    names = {t.name for t in tools_list}
     assert names == {
         "review_pr",
         "check_pr_size",
@@ -30,11 +39,9 @@ async def test_list_tools_returns_all():
     }
 
 
-@pytest.mark.asyncio
-async def test_list_tools_have_schemas():
+def test_list_tools_have_schemas(tools_list):
     """Each tool has an input schema."""
-    tools = await list_tools()
-    for tool in tools:
+    for tool in tools_list:
         assert tool.inputSchema is not None
         assert tool.inputSchema["type"] == "object"
 
@@ -72,7 +79,7 @@ async def test_review_pr_lint_gate_fails(mock_key, mock_token):
     ):
         mock_pr = MagicMock()
         mock_gh.return_value.fetch_pr.return_value = mock_pr
-        mock_size.return_value = MagicMock(passed=True)
+        mock_size.return_value = _PASS
         mock_lint.return_value = MagicMock(passed=False, error_count=5)
 
         result = await _review_pr({"repo": "org/repo", "pr_number": 1})
@@ -89,11 +96,11 @@ async def test_check_pr_size_passed(mock_token):
         patch("pr_review_agent.config.load_config") as mock_config,
         patch("pr_review_agent.gates.size_gate.check_size") as mock_size,
     ):
-        mock_pr = MagicMock(lines_added=50, lines_removed=10, files_changed=["a.py"])
-        mock_gh.return_value.fetch_pr.return_value = mock_pr
-        mock_size.return_value = MagicMock(passed=True)
-        mock_config.return_value = MagicMock(
-            limits=MagicMock(max_lines_changed=500, max_files_changed=20)
+        pr = SimpleNamespace(lines_added=50, lines_removed=10, files_changed=["a.py"])
+        mock_gh.return_value.fetch_pr = lambda *args, **kwargs: pr
+        mock_size.return_value = _PASS
+        mock_config.return_value = SimpleNamespace(
+            limits=SimpleNamespace(max_lines_changed=500, max_files_changed=20)
         )
 
         result = await _check_pr_size({"repo": "org/repo", "pr_number": 1})
@@ -123,20 +130,25 @@ async def test_check_pr_lint_failed(mock_token):
         assert "12" in result[0].text
 
 
+@pytest.fixture
+def clean_supabase_env(monkeypatch):
+    """Unset only the Supabase credentials instead of clearing os.environ."""
+    monkeypatch.delenv("SUPABASE_URL", raising=False)
+    monkeypatch.delenv("SUPABASE_KEY", raising=False)
+
+
 @pytest.mark.asyncio
-async def test_get_review_history_no_supabase():
+async def test_get_review_history_no_supabase(clean_supabase_env):
     """get_review_history returns error without credentials."""
-    with patch.dict("os.environ", {}, clear=True):
-        result = await _get_review_history({"repo": "org/repo"})
-        assert "SUPABASE_URL" in result[0].text
+    result = await _get_review_history({"repo": "org/repo"})
+    assert "SUPABASE_URL" in result[0].text
 
 
 @pytest.mark.asyncio
-async def test_get_cost_summary_no_supabase():
+async def test_get_cost_summary_no_supabase(clean_supabase_env):
     """get_cost_summary returns error without credentials."""
-    with patch.dict("os.environ", {}, clear=True):
-        result = await _get_cost_summary({})
-        assert "SUPABASE_URL" in result[0].text
+    result = await _get_cost_summary({})
+    assert "SUPABASE_URL" in result[0].text
 
 
 # --- call_tool dispatcher tests ---
@@ -219,7 +231,7 @@ async def test_review_pr_full_success(mock_key, mock_token):
         mock_config.return_value = MagicMock(
             llm=MagicMock(default_model="claude-sonnet-4-20250514")
         )
-        mock_size.return_value = MagicMock(passed=True)
+        mock_size.return_value = _PASS
         mock_lint.return_value = MagicMock(passed=True)
 
         mock_issue = MagicMock(
@@ -262,7 +274,7 @@ async def test_review_pr_no_issues(mock_key, mock_token):
         mock_config.return_value = MagicMock(
             llm=MagicMock(default_model="claude-sonnet-4-20250514")
         )
-        mock_size.return_value = MagicMock(passed=True)
+        mock_size.return_value = _PASS
         mock_lint.return_value = MagicMock(passed=True)
         mock_review = MagicMock(
             summary="All good", issues=[], model="claude-sonnet-4-20250514", cost_usd=0.001
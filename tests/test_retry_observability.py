@@ -1,11 +1,14 @@
 """Tests for per-attempt observability logging in retry handler."""
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import anthropic
+import pytest
 
 from pr_review_agent.execution.retry_handler import (
     AttemptRecord,
+    RetryExhaustedError,
     RetryResult,
     RetryStrategy,
     retry_with_adaptation,
@@ -13,6 +16,37 @@ from pr_review_agent.execution.retry_handler import (
 from pr_review_agent.metrics.supabase_logger import SupabaseLogger
 
 
+# Error factories: each raise gets its own instance, so no test inherits another's
+# traceback. The handler only reads status_code/headers off the response, so a
+# SimpleNamespace suffices.
+def _rate_limit_err():
+    return anthropic.RateLimitError(
+        message="rate limited",
+        response=SimpleNamespace(status_code=429, headers={}, request=None),
+        body={"error": {"message": "rate limited"}},
+    )
+
+
+def _context_err():
+    return anthropic.BadRequestError(
+        message="context length exceeded",
+        response=SimpleNamespace(status_code=400, headers={}, request=None),
+        body={"error": {"message": "context length exceeded"}},
+    )
+
+
+def _api_err():
+    return anthropic.APIError(
+        message="internal error",
+        request=None,
+        body={"error": {"message": "internal error"}},
+    )
+
+
+def _no_sleep(_seconds: float) -> None:
+    """Stand-in for time.sleep so retries don't actually back off."""
+
+
 class TestAttemptRecord:
     """Test AttemptRecord captures correct data."""
 
@@ -27,6 +61,7 @@ class TestAttemptRecord:
             operation=operation,
             base_model="claude-sonnet-4-20250514",
             max_attempts=3,
+            sleep=_no_sleep,
         )
 
         assert retry_result.result is result
@@ -46,19 +81,15 @@ class TestAttemptRecord:
             nonlocal call_count
             call_count += 1
             if call_count == 1:
-                raise anthropic.RateLimitError(
-                    message="rate limited",
-                    response=MagicMock(status_code=429),
-                    body={"error": {"message": "rate limited"}},
-                )
+                raise _rate_limit_err()
             return "success"
 
-        with patch("pr_review_agent.execution.retry_handler.time.sleep"):
-            retry_result = retry_with_adaptation(
-                operation=operation,
-                base_model="claude-sonnet-4-20250514",
-                max_attempts=3,
-            )
+        retry_result = retry_with_adaptation(
+            operation=operation,
+            base_model="claude-sonnet-4-20250514",
+            max_attempts=3,
+            sleep=_no_sleep,
+        )
 
         assert retry_result.result == "success"
         assert len(retry_result.attempts) == 2
@@ -80,19 +111,15 @@ class TestAttemptRecord:
             nonlocal call_count
             call_count += 1
             if call_count == 1:
-                raise anthropic.BadRequestError(
-                    message="context length exceeded",
-                    response=MagicMock(status_code=400),
-                    body={"error": {"message": "context length exceeded"}},
-                )
+                raise _context_err()
             return "success"
 
-        with patch("pr_review_agent.execution.retry_handler.time.sleep"):
-            retry_result = retry_with_adaptation(
-                operation=operation,
-                base_model="claude-sonnet-4-20250514",
-                max_attempts=3,
-            )
+        retry_result = retry_with_adaptation(
+            operation=operation,
+            base_model="claude-sonnet-4-20250514",
+            max_attempts=3,
+            sleep=_no_sleep,
+        )
 
         assert retry_result.attempts[0].failure_type == "context_too_long"
         assert retry_result.attempts[1].strategy_applied is not None
@@ -106,19 +133,15 @@ class TestAttemptRecord:
             nonlocal call_count
             call_count += 1
             if call_count == 1:
-                raise anthropic.APIError(
-                    message="internal error",
-                    request=MagicMock(),
-                    body={"error": {"message": "internal error"}},
-                )
+                raise _api_err()
             return "success"
 
-        with patch("pr_review_agent.execution.retry_handler.time.sleep"):
-            retry_result = retry_with_adaptation(
-                operation=operation,
-                base_model="claude-sonnet-4-20250514",
-                max_attempts=3,
-            )
+        retry_result = retry_with_adaptation(
+            operation=operation,
+            base_model="claude-sonnet-4-20250514",
+            max_attempts=3,
+            sleep=_no_sleep,
+        )
 
         assert retry_result.attempts[0].failure_type == "api_error"
 
@@ -136,13 +159,13 @@ class TestAttemptRecord:
         def validator(result):
             return result == "good"
 
-        with patch("pr_review_agent.execution.retry_handler.time.sleep"):
-            retry_result = retry_with_adaptation(
-                operation=operation,
-                base_model="claude-sonnet-4-20250514",
-                max_attempts=3,
-                validator=validator,
-            )
+        retry_result = retry_with_adaptation(
+            operation=operation,
+            base_model="claude-sonnet-4-20250514",
+            max_attempts=3,
+            validator=validator,
+            sleep=_no_sleep,
+        )
 
         assert retry_result.attempts[0].failure_type == "low_quality_response"
         assert retry_result.attempts[1].failure_type is None
@@ -150,24 +173,19 @@ class TestAttemptRecord:
     def test_all_attempts_exhausted(self):
         """All attempts fail - all recorded before raising."""
         def operation(strategy: RetryStrategy):
-            raise anthropic.RateLimitError(
-                message="rate limited",
-                response=MagicMock(status_code=429),
-                body={"error": {"message": "rate limited"}},
+            raise _rate_limit_err()
+
+        with pytest.raises(RetryExhaustedError) as exc_info:
+            retry_with_adaptation(
+                operation=operation,
+                base_model="claude-sonnet-4-20250514",
+                max_attempts=3,
+                sleep=_no_sleep,
             )
 
-        with patch("pr_review_agent.execution.retry_handler.time.sleep"):
-            try:
-                retry_with_adaptation(
-                    operation=operation,
-                    base_model="claude-sonnet-4-20250514",
-                    max_attempts=3,
-                )
-            except Exception as e:
-                # The exception should carry the attempts
-                assert hasattr(e, "attempts")
-                assert len(e.attempts) == 3
-                assert all(a.failure_type == "rate_limit" for a in e.attempts)
+        # The exception should carry the attempts
+        assert len(exc_info.value.attempts) == 3
+        assert all(a.failure_type == "rate_limit" for a in exc_info.value.attempts)
 
     def test_latency_measured(self):
         """Latency is measured for each attempt."""
@@ -178,6 +196,7 @@ class TestAttemptRecord:
             operation=operation,
             base_model="claude-sonnet-4-20250514",
             max_attempts=1,
+            sleep=_no_sleep,
         )
 
         assert retry_result.attempts[0].latency_ms >= 0
@@ -190,19 +209,15 @@ class TestAttemptRecord:
             nonlocal call_count
             call_count += 1
             if call_count == 1:
-                raise anthropic.RateLimitError(
-                    message="rate limited",
-                    response=MagicMock(status_code=429),
-                    body={"error": {"message": "rate limited"}},
-                )
+                raise _rate_limit_err()
             return "success"
 
-        with patch("pr_review_agent.execution.retry_handler.time.sleep"):
-            retry_result = retry_with_adaptation(
-                operation=operation,
-                base_model="claude-sonnet-4-20250514",
-                max_attempts=3,
-            )
+        retry_result = retry_with_adaptation(
+            operation=operation,
+            base_model="claude-sonnet-4-20250514",
+            max_attempts=3,
+            sleep=_no_sleep,
+        )
 
         # Second attempt should have strategy info
         assert retry_result.attempts[1].strategy_applied is not None
@@ -240,64 +255,73 @@ class TestRetryResult:
         assert multi.was_retried is True
 
 
+@pytest.fixture(scope="class")
+def supabase_logger_factory():
+    """Build SupabaseLogger instances over one shared, pre-wired client mock.
+
+    The create_client patch and mock tree are set up once per class; each call
+    resets recorded calls and the insert side effect so tests stay order-independent.
+    """
+    template = MagicMock()
+    template.table.return_value.insert.return_value.execute.return_value = MagicMock(
+        data=[{"id": "abc"}]
+    )
+
+    def factory():
+        template.reset_mock()
+        template.table.return_value.insert.side_effect = None
+        return SupabaseLogger("http://test", "key"), template
+
+    with patch(
+        "pr_review_agent.metrics.supabase_logger.create_client",
+        return_value=template,
+    ):
+        yield factory
+
+
 class TestSupabaseAttemptLogging:
     """Test logging attempts to Supabase."""
 
-    def test_log_attempts_inserts_records(self):
+    def test_log_attempts_inserts_records(self, supabase_logger_factory):
         """Each attempt is logged as a separate row."""
-        mock_client = MagicMock()
-        mock_client.table.return_value.insert.return_value.execute.return_value = MagicMock(
-            data=[{"id": "abc"}]
-        )
-
-        with patch(
-            "pr_review_agent.metrics.supabase_logger.create_client",
-            return_value=mock_client,
-        ):
-            logger = SupabaseLogger("http://test", "key")
-            attempts = [
-                AttemptRecord(
-                    attempt_number=1,
-                    model_used="claude-sonnet-4-20250514",
-                    failure_type="rate_limit",
-                    strategy_applied=None,
-                    latency_ms=150,
-                ),
-                AttemptRecord(
-                    attempt_number=2,
-                    model_used="claude-haiku-4-5-20251001",
-                    failure_type=None,
-                    strategy_applied="model_downgrade",
-                    latency_ms=200,
-                ),
-            ]
-
-            logger.log_attempts(review_id="review-123", attempts=attempts)
-
-            # Should insert to review_attempts table
-            mock_client.table.assert_called_with("review_attempts")
-            insert_call = mock_client.table.return_value.insert
-            inserted_data = insert_call.call_args[0][0]
-            assert len(inserted_data) == 2
-            assert inserted_data[0]["attempt_number"] == 1
-            assert inserted_data[0]["failure_type"] == "rate_limit"
-            assert inserted_data[0]["review_id"] == "review-123"
-            assert inserted_data[1]["attempt_number"] == 2
-            assert inserted_data[1]["model_used"] == "claude-haiku-4-5-20251001"
-
-    def test_log_attempts_handles_error_gracefully(self):
+        logger, mock_client = supabase_logger_factory()
+        attempts = [
+            AttemptRecord(
+                attempt_number=1,
+                model_used="claude-sonnet-4-20250514",
+                failure_type="rate_limit",
+                strategy_applied=None,
+                latency_ms=150,
+            ),
+            AttemptRecord(
+                attempt_number=2,
+                model_used="claude-haiku-4-5-20251001",
+                failure_type=None,
+                strategy_applied="model_downgrade",
+                latency_ms=200,
+            ),
+        ]
+
+        logger.log_attempts(review_id="review-123", attempts=attempts)
+
+        # Should insert to review_attempts table
+        mock_client.table.assert_called_with("review_attempts")
+        insert_call = mock_client.table.return_value.insert
+        inserted_data = insert_call.call_args[0][0]
+        assert len(inserted_data) == 2
+        assert inserted_data[0]["attempt_number"] == 1
+        assert inserted_data[0]["failure_type"] == "rate_limit"
+        assert inserted_data[0]["review_id"] == "review-123"
+        assert inserted_data[1]["attempt_number"] == 2
+        assert inserted_data[1]["model_used"] == "claude-haiku-4-5-20251001"
+
+    def test_log_attempts_handles_error_gracefully(self, supabase_logger_factory):
         """Logging failure doesn't raise."""
-        mock_client = MagicMock()
+        logger, mock_client = supabase_logger_factory()
         mock_client.table.return_value.insert.side_effect = Exception("db error")
+        attempts = [
+            AttemptRecord(attempt_number=1, model_used="m", latency_ms=100),
+        ]
 
-        with patch(
-            "pr_review_agent.metrics.supabase_logger.create_client",
-            return_value=mock_client,
-        ):
-            logger = SupabaseLogger("http://test", "key")
-            attempts = [
-                AttemptRecord(attempt_number=1, model_used="m", latency_ms=100),
-            ]
-
-            # Should not raise
-            logger.log_attempts(review_id="review-123", attempts=attempts)
+        # Should not raise
+        logger.log_attempts(review_id="review-123", attempts=attempts)
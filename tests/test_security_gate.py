@@ -1,5 +1,7 @@
 """Tests for security gate."""
 
+import json
+import subprocess
 from unittest.mock import patch
 
 from pr_review_agent.config import Config, SecurityConfig
@@ -9,6 +11,34 @@ from pr_review_agent.gates.security_gate import (
     run_security_scan,
 )
 
+# What `bandit -f json` reports for a subprocess call with shell=True.
+_BANDIT_REPORT = json.dumps({
+    "results": [
+        {
+            "filename": "insecure.py",
+            "line_number": 3,
+            "issue_severity": "HIGH",
+            "issue_confidence": "HIGH",
+            "test_id": "B602",
+            "issue_text": "subprocess call with shell=True identified, security issue.",
+        }
+    ]
+})
+
+
+def _bandit_result(stdout: str = _BANDIT_REPORT) -> subprocess.CompletedProcess:
+    """A finished Bandit run; Bandit exits 1 when it reports issues."""
+    return subprocess.CompletedProcess(args=[], returncode=1, stdout=stdout, stderr="")
+
+
+def _scan(**security) -> SecurityGateResult:
+    """Run the gate on insecure.py with Bandit stubbed to report _BANDIT_REPORT."""
+    config = Config(security=SecurityConfig(enabled=True, **security))
+    with patch(
+        "pr_review_agent.gates.security_gate.subprocess.run", return_value=_bandit_result()
+    ):
+        return run_security_scan(["insecure.py"], config)
+
 
 def test_security_gate_disabled():
     """Disabled security gate should always pass."""
@@ -51,56 +81,43 @@ def test_security_gate_clean_files(tmp_path):
     assert result.findings == []
 
 
-def test_security_gate_detects_issues(tmp_path):
-    """Files with security issues should be detected."""
-    test_file = tmp_path / "insecure.py"
-    test_file.write_text(
-        'import subprocess\n'
-        'def run(cmd):\n'
-        '    subprocess.call(cmd, shell=True)\n'
+def test_security_gate_runs_bandit_on_python_files():
+    """The gate asks Bandit for a JSON report on the Python files only."""
+    config = Config(security=SecurityConfig(enabled=True))
+
+    with patch(
+        "pr_review_agent.gates.security_gate.subprocess.run", return_value=_bandit_result("")
+    ) as run:
+        run_security_scan(["app.py", "README.md", "lib/util.py"], config)
+
+    run.assert_called_once_with(
+        ["bandit", "-f", "json", "-q", "app.py", "lib/util.py"],
+        capture_output=True,
+        text=True,
     )
 
-    config = Config(security=SecurityConfig(enabled=True, max_findings=0))
 
-    result = run_security_scan([str(test_file)], config)
+def test_security_gate_detects_issues():
+    """Files with security issues should be detected."""
+    result = _scan(max_findings=0)
 
     assert result.passed is False
-    assert len(result.findings) >= 1
-    assert result.severity_counts["HIGH"] >= 1 or result.severity_counts["MEDIUM"] >= 1
+    assert [f.test_id for f in result.findings] == ["B602"]
+    assert result.severity_counts["HIGH"] == 1
 
 
-def test_security_gate_respects_max_findings(tmp_path):
+def test_security_gate_respects_max_findings():
     """Gate should pass if findings under max_findings threshold."""
-    test_file = tmp_path / "minor.py"
-    test_file.write_text(
-        'import subprocess\n'
-        'def run(cmd):\n'
-        '    subprocess.call(cmd, shell=True)\n'
-    )
-
-    config = Config(security=SecurityConfig(enabled=True, max_findings=50))
-
-    result = run_security_scan([str(test_file)], config)
+    result = _scan(max_findings=50)
 
     # Should pass because findings < max_findings
     assert result.passed is True
 
 
-def test_security_gate_fail_on_severity(tmp_path):
+def test_security_gate_fail_on_severity():
     """Gate should fail based on severity threshold."""
-    test_file = tmp_path / "high_sev.py"
-    test_file.write_text(
-        'import subprocess\n'
-        'def run(cmd):\n'
-        '    subprocess.call(cmd, shell=True)\n'
-    )
-
     # Only fail on critical - high severity should pass
-    config = Config(security=SecurityConfig(
-        enabled=True, fail_on_severity="critical", max_findings=50
-    ))
-
-    result = run_security_scan([str(test_file)], config)
+    result = _scan(fail_on_severity="critical", max_findings=0)
 
     # Should pass because we only fail on critical, and this is high/medium
     assert result.passed is True
@@ -24,12 +24,19 @@ def make_pr(lines_added: int = 10, lines_removed: int = 5, files: int = 3) -> PR
     )
 
 
+# check_size only reads its inputs, so the PRs and configs are built once.
+_SMALL_PR = make_pr(lines_added=50, lines_removed=10, files=3)
+_BIG_LINES_PR = make_pr(lines_added=200, lines_removed=50, files=5)
+_BIG_FILES_PR = make_pr(lines_added=10, lines_removed=5, files=10)
+
+_CFG_OK = Config(limits=LimitsConfig(max_lines_changed=500, max_files_changed=20))
+_CFG_TIGHT_LINES = Config(limits=LimitsConfig(max_lines_changed=100, max_files_changed=20))
+_CFG_TIGHT_FILES = Config(limits=LimitsConfig(max_lines_changed=500, max_files_changed=5))
+
+
 def test_size_gate_passes_small_pr():
     """Small PR should pass size gate."""
-    config = Config(limits=LimitsConfig(max_lines_changed=500, max_files_changed=20))
-    pr = make_pr(lines_added=50, lines_removed=10, files=3)
-
-    result = check_size(pr, config)
+    result = check_size(_SMALL_PR, _CFG_OK)
 
     assert result.passed is True
     assert result.lines_changed == 60
@@ -38,10 +45,7 @@ def test_size_gate_passes_small_pr():
 
 def test_size_gate_fails_too_many_lines():
     """PR with too many lines should fail."""
-    config = Config(limits=LimitsConfig(max_lines_changed=100, max_files_changed=20))
-    pr = make_pr(lines_added=200, lines_removed=50, files=5)
-
-    result = check_size(pr, config)
+    result = check_size(_BIG_LINES_PR, _CFG_TIGHT_LINES)
 
     assert result.passed is False
     assert "250 lines" in result.reason
@@ -50,10 +54,7 @@ def test_size_gate_fails_too_many_lines():
 
 def test_size_gate_fails_too_many_files():
     """PR with too many files should fail."""
-    config = Config(limits=LimitsConfig(max_lines_changed=500, max_files_changed=5))
-    pr = make_pr(lines_added=10, lines_removed=5, files=10)
-
-    result = check_size(pr, config)
+    result = check_size(_BIG_FILES_PR, _CFG_TIGHT_FILES)
 
     assert result.passed is False
     assert "10 files" in result.reason
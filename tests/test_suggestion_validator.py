@@ -1,6 +1,6 @@
 """Tests for code suggestion validation."""
 
-from pr_review_agent.review.suggestion_validator import validate_suggestion
+from pr_review_agent.review.suggestion_validator import _validate_cached, validate_suggestion
 
 
 class TestValidateSuggestion:
@@ -92,3 +92,12 @@ class TestValidateSuggestion:
         """Class definition without body is valid."""
         code = "class MyHandler(BaseHandler):"
         assert validate_suggestion(code, "file.py") == code
+
+    def test_repeated_suggestion_for_other_file_is_cached(self):
+        """Same snippet for another Python file reuses the cached result."""
+        code = "result = compute_total(items)"
+        assert validate_suggestion(code, "src/a.py") == code
+        hits_before = _validate_cached.cache_info().hits
+
+        assert validate_suggestion(code, "src/b.py") == code
+        assert _validate_cached.cache_info().hits == hits_before + 1
@@ -1,6 +1,8 @@
 """Tests for Supabase metrics logger."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
+
+import pytest
 
 from pr_review_agent.gates.lint_gate import LintGateResult
 from pr_review_agent.gates.size_gate import SizeGateResult
@@ -29,15 +31,26 @@ def make_pr() -> PRData:
     )
 
 
-@patch("pr_review_agent.metrics.supabase_logger.create_client")
-def test_log_review_full(mock_create_client):
-    """Test logging a full review with all data."""
-    mock_table = MagicMock()
-    mock_client = MagicMock()
+@pytest.fixture
+def supabase(monkeypatch):
+    """Stub create_client with a client whose table().insert().execute() chain works.
+
+    Returns (mock_client, mock_table).
+    """
+    mock_client, mock_table = MagicMock(), MagicMock()
     mock_client.table.return_value = mock_table
     mock_table.insert.return_value = mock_table
     mock_table.execute.return_value = MagicMock(data=[{"id": "123"}])
-    mock_create_client.return_value = mock_client
+    monkeypatch.setattr(
+        "pr_review_agent.metrics.supabase_logger.create_client",
+        lambda *args, **kwargs: mock_client,
+    )
+    return mock_client, mock_table
+
+
+def test_log_review_full(supabase):
+    """Test logging a full review with all data."""
+    mock_client, mock_table = supabase
 
     logger = SupabaseLogger("https://test.supabase.co", "test-key")
 
@@ -88,15 +101,9 @@ def test_log_review_full(mock_create_client):
     assert call_args["cost_usd"] == 0.001
 
 
-@patch("pr_review_agent.metrics.supabase_logger.create_client")
-def test_log_review_gated(mock_create_client):
+def test_log_review_gated(supabase):
     """Test logging a review that was gated (no LLM call)."""
-    mock_table = MagicMock()
-    mock_client = MagicMock()
-    mock_client.table.return_value = mock_table
-    mock_table.insert.return_value = mock_table
-    mock_table.execute.return_value = MagicMock(data=[{"id": "456"}])
-    mock_create_client.return_value = mock_client
+    _, mock_table = supabase
 
     logger = SupabaseLogger("https://test.supabase.co", "test-key")
 
@@ -1,42 +1,42 @@
 """Tests for token usage tracking."""
 
+import math
+
+import pytest
+
 from pr_review_agent.metrics.token_tracker import (
     TokenUsage,
     calculate_cost,
     track_usage,
 )
 
+pytestmark = pytest.mark.xdist_group("token_tracker")
 
-def test_calculate_cost_sonnet():
-    """Calculate cost for Sonnet model."""
-    cost = calculate_cost("claude-sonnet-4-20250514", 1000, 500)
-
-    # 1000 * 0.003/1000 + 500 * 0.015/1000 = 0.003 + 0.0075 = 0.0105
-    assert abs(cost - 0.0105) < 1e-6
-
+_TOL = 1e-6
+_SONNET_1K_500 = calculate_cost("claude-sonnet-4-20250514", 1000, 500)
 
-def test_calculate_cost_haiku():
-    """Calculate cost for Haiku model."""
-    cost = calculate_cost("claude-haiku-4-5-20251001", 1000, 500)
 
-    # 1000 * 0.001/1000 + 500 * 0.005/1000 = 0.001 + 0.0025 = 0.0035
-    assert abs(cost - 0.0035) < 1e-6
-
-
-def test_calculate_cost_opus():
-    """Calculate cost for Opus model."""
-    cost = calculate_cost("claude-opus-4-20250514", 1000, 500)
+@pytest.mark.parametrize(
+    "model,input_tokens,output_tokens,expected",
+    [
+        # 1000 * 0.003/1000 + 500 * 0.015/1000 = 0.003 + 0.0075 = 0.0105
+        pytest.param("claude-sonnet-4-20250514", 1000, 500, 0.0105, id="sonnet"),
+        # 1000 * 0.001/1000 + 500 * 0.005/1000 = 0.001 + 0.0025 = 0.0035
+        pytest.param("claude-haiku-4-5-20251001", 1000, 500, 0.0035, id="haiku"),
+        # 1000 * 0.015/1000 + 500 * 0.075/1000 = 0.015 + 0.0375 = 0.0525
+        pytest.param("claude-opus-4-20250514", 1000, 500, 0.0525, id="opus"),
+    ],
+)
+def test_calculate_cost(model, input_tokens, output_tokens, expected):
+    """Calculate cost from the per-model pricing table."""
+    cost = calculate_cost(model, input_tokens, output_tokens)
 
-    # 1000 * 0.015/1000 + 500 * 0.075/1000 = 0.015 + 0.0375 = 0.0525
-    assert abs(cost - 0.0525) < 1e-6
+    assert math.isclose(cost, expected, abs_tol=_TOL)
 
 
 def test_calculate_cost_unknown_model_defaults_to_sonnet():
     """Unknown model falls back to Sonnet pricing."""
-    cost = calculate_cost("unknown-model", 1000, 500)
-
-    expected = calculate_cost("claude-sonnet-4-20250514", 1000, 500)
-    assert cost == expected
+    assert calculate_cost("unknown-model", 1000, 500) == _SONNET_1K_500
 
 
 def test_track_usage():
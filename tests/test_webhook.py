@@ -1,36 +1,22 @@
 """Tests for escalation webhook notifications."""
 
-from unittest.mock import MagicMock, patch
+import dataclasses
+from unittest.mock import MagicMock
+
+import pytest
+import requests
 
 from pr_review_agent.config import EscalationConfig
 from pr_review_agent.escalation.webhook import (
-    EscalationPayload,
     _format_generic_payload,
     _format_slack_payload,
     build_payload,
     send_webhook,
     should_escalate,
 )
-from pr_review_agent.github_client import PRData
 from pr_review_agent.review.confidence import ConfidenceResult
 
-
-def _make_pr() -> PRData:
-    return PRData(
-        owner="testorg",
-        repo="testrepo",
-        number=42,
-        title="Fix auth bug",
-        author="dev1",
-        description="Fixes login issue",
-        diff="+ fix",
-        files_changed=["src/auth.py"],
-        lines_added=10,
-        lines_removed=5,
-        base_branch="main",
-        head_branch="fix/auth",
-        url="https://github.com/testorg/testrepo/pull/42",
-    )
+pytestmark = pytest.mark.xdist_group("webhook")
 
 
 def _make_confidence(score: float, level: str) -> ConfidenceResult:
@@ -42,62 +28,43 @@ def _make_confidence(score: float, level: str) -> ConfidenceResult:
     )
 
 
-class TestShouldEscalate:
-    def test_escalates_when_below_threshold(self):
-        config = EscalationConfig(
-            enabled=True,
-            webhook_url="https://hooks.slack.com/test",
-            trigger_below_confidence=0.5,
-        )
-        confidence = _make_confidence(0.3, "low")
-        assert should_escalate(confidence, config) is True
+@pytest.fixture(scope="module")
+def low_confidence() -> ConfidenceResult:
+    return _make_confidence(0.3, "low")
 
-    def test_no_escalation_when_above_threshold(self):
-        config = EscalationConfig(
-            enabled=True,
-            webhook_url="https://hooks.slack.com/test",
-            trigger_below_confidence=0.5,
-        )
-        confidence = _make_confidence(0.7, "medium")
-        assert should_escalate(confidence, config) is False
 
-    def test_no_escalation_when_disabled(self):
-        config = EscalationConfig(
-            enabled=False,
-            webhook_url="https://hooks.slack.com/test",
-            trigger_below_confidence=0.5,
-        )
-        confidence = _make_confidence(0.3, "low")
-        assert should_escalate(confidence, config) is False
+_BASE_CONF = _make_confidence(0.5, "medium")
+_SLACK_URL = "https://hooks.slack.com/test"
 
-    def test_no_escalation_when_no_url(self):
-        config = EscalationConfig(
-            enabled=True,
-            webhook_url="",
-            trigger_below_confidence=0.5,
-        )
-        confidence = _make_confidence(0.3, "low")
-        assert should_escalate(confidence, config) is False
 
-    def test_escalation_at_exact_threshold(self):
+class TestShouldEscalate:
+    @pytest.mark.parametrize(
+        "enabled,url,threshold,score,expected",
+        [
+            pytest.param(True, _SLACK_URL, 0.5, 0.3, True, id="below_threshold"),
+            pytest.param(True, _SLACK_URL, 0.5, 0.7, False, id="above_threshold"),
+            pytest.param(False, _SLACK_URL, 0.5, 0.3, False, id="disabled"),
+            pytest.param(True, "", 0.5, 0.3, False, id="no_url"),
+            pytest.param(True, _SLACK_URL, 0.5, 0.5, False, id="exact_threshold"),
+        ],
+    )
+    def test_should_escalate(self, enabled, url, threshold, score, expected):
         config = EscalationConfig(
-            enabled=True,
-            webhook_url="https://hooks.slack.com/test",
-            trigger_below_confidence=0.5,
+            enabled=enabled,
+            webhook_url=url,
+            trigger_below_confidence=threshold,
         )
-        confidence = _make_confidence(0.5, "medium")
-        assert should_escalate(confidence, config) is False
+        confidence = dataclasses.replace(_BASE_CONF, score=score)
+        assert should_escalate(confidence, config) is expected
 
 
 class TestBuildPayload:
-    def test_builds_complete_payload(self):
-        pr = _make_pr()
-        confidence = _make_confidence(0.3, "low")
-        payload = build_payload(pr, confidence, "Issues found in auth")
-
-        assert payload.pr_url == pr.url
-        assert payload.pr_title == pr.title
-        assert payload.pr_author == pr.author
+    def test_builds_complete_payload(self, base_pr, low_confidence):
+        payload = build_payload(base_pr, low_confidence, "Issues found in auth")
+
+        assert payload.pr_url == base_pr.url
+        assert payload.pr_title == base_pr.title
+        assert payload.pr_author == base_pr.author
         assert payload.repo == "testorg/testrepo"
         assert payload.pr_number == 42
         assert payload.confidence_score == 0.3
@@ -105,33 +72,19 @@ class TestBuildPayload:
         assert payload.review_summary == "Issues found in auth"
         assert "below threshold" in payload.escalation_reason
 
-    def test_includes_high_penalty_factors(self):
-        pr = _make_pr()
-        confidence = ConfidenceResult(
-            score=0.2,
-            level="low",
-            factors={"issues": -0.6, "concerns": -0.3},
-            recommendation="request_human_review",
+    def test_includes_high_penalty_factors(self, base_pr, low_confidence):
+        confidence = dataclasses.replace(
+            low_confidence, score=0.2, factors={"issues": -0.6, "concerns": -0.3}
         )
-        payload = build_payload(pr, confidence, "Summary")
+        payload = build_payload(base_pr, confidence, "Summary")
 
         assert "issues" in payload.escalation_reason
         assert "concerns" in payload.escalation_reason
 
 
 class TestFormatSlackPayload:
-    def test_slack_format_structure(self):
-        payload = EscalationPayload(
-            pr_url="https://github.com/org/repo/pull/1",
-            pr_title="Test PR",
-            pr_author="dev",
-            repo="org/repo",
-            pr_number=1,
-            confidence_score=0.2,
-            confidence_level="low",
-            review_summary="Issues found",
-            escalation_reason="Low confidence",
-        )
+    def test_slack_format_structure(self, payload_factory):
+        payload = payload_factory(confidence_score=0.2)
         result = _format_slack_payload(payload)
 
         assert "attachments" in result
@@ -140,35 +93,15 @@ class TestFormatSlackPayload:
         assert "Escalation" in attachment["title"]
         assert len(attachment["fields"]) == 5
 
-    def test_slack_yellow_for_borderline(self):
-        payload = EscalationPayload(
-            pr_url="url",
-            pr_title="PR",
-            pr_author="dev",
-            repo="org/repo",
-            pr_number=1,
-            confidence_score=0.4,
-            confidence_level="low",
-            review_summary="Summary",
-            escalation_reason="Reason",
-        )
+    def test_slack_yellow_for_borderline(self, payload_factory):
+        payload = payload_factory(confidence_score=0.4)
         result = _format_slack_payload(payload)
         assert result["attachments"][0]["color"] == "#ffc107"
 
 
 class TestFormatGenericPayload:
-    def test_generic_format_structure(self):
-        payload = EscalationPayload(
-            pr_url="https://github.com/org/repo/pull/1",
-            pr_title="Test PR",
-            pr_author="dev",
-            repo="org/repo",
-            pr_number=1,
-            confidence_score=0.3,
-            confidence_level="low",
-            review_summary="Issues found",
-            escalation_reason="Low confidence",
-        )
+    def test_generic_format_structure(self, payload_factory):
+        payload = payload_factory(pr_url="https://github.com/org/repo/pull/1")
         result = _format_generic_payload(payload)
 
         assert result["event"] == "review_escalation"
@@ -177,25 +110,19 @@ class TestFormatGenericPayload:
 
 
 class TestSendWebhook:
-    @patch("pr_review_agent.escalation.webhook.requests.post")
-    def test_sends_slack_webhook(self, mock_post):
-        mock_post.return_value = MagicMock(ok=True)
+    @pytest.fixture(autouse=True)
+    def mock_post(self, monkeypatch):
+        mock = MagicMock(return_value=MagicMock(ok=True))
+        monkeypatch.setattr("pr_review_agent.escalation.webhook.requests.post", mock)
+        return mock
+
+    def test_sends_slack_webhook(self, mock_post, payload_factory):
         config = EscalationConfig(
             enabled=True,
             webhook_url="https://hooks.slack.com/services/T/B/X",
             slack_format=True,
         )
-        payload = EscalationPayload(
-            pr_url="url",
-            pr_title="PR",
-            pr_author="dev",
-            repo="org/repo",
-            pr_number=1,
-            confidence_score=0.3,
-            confidence_level="low",
-            review_summary="Summary",
-            escalation_reason="Reason",
-        )
+        payload = payload_factory()
 
         result = send_webhook(payload, config)
 
@@ -204,25 +131,13 @@ class TestSendWebhook:
         call_kwargs = mock_post.call_args
         assert "attachments" in call_kwargs.kwargs["json"]
 
-    @patch("pr_review_agent.escalation.webhook.requests.post")
-    def test_sends_generic_webhook(self, mock_post):
-        mock_post.return_value = MagicMock(ok=True)
+    def test_sends_generic_webhook(self, mock_post, payload_factory):
         config = EscalationConfig(
             enabled=True,
             webhook_url="https://example.com/webhook",
             slack_format=False,
         )
-        payload = EscalationPayload(
-            pr_url="url",
-            pr_title="PR",
-            pr_author="dev",
-            repo="org/repo",
-            pr_number=1,
-            confidence_score=0.3,
-            confidence_level="low",
-            review_summary="Summary",
-            escalation_reason="Reason",
-        )
+        payload = payload_factory()
 
         result = send_webhook(payload, config)
 
@@ -230,45 +145,22 @@ class TestSendWebhook:
         call_kwargs = mock_post.call_args
         assert call_kwargs.kwargs["json"]["event"] == "review_escalation"
 
-    @patch("pr_review_agent.escalation.webhook.requests.post")
-    def test_returns_false_on_http_error(self, mock_post):
+    def test_returns_false_on_http_error(self, mock_post, payload_factory):
         mock_post.return_value = MagicMock(ok=False, status_code=500)
         config = EscalationConfig(
             enabled=True,
             webhook_url="https://hooks.slack.com/test",
         )
-        payload = EscalationPayload(
-            pr_url="url",
-            pr_title="PR",
-            pr_author="dev",
-            repo="org/repo",
-            pr_number=1,
-            confidence_score=0.3,
-            confidence_level="low",
-            review_summary="Summary",
-            escalation_reason="Reason",
-        )
+        payload = payload_factory()
 
         assert send_webhook(payload, config) is False
 
-    @patch("pr_review_agent.escalation.webhook.requests.post")
-    def test_returns_false_on_network_error(self, mock_post):
-        import requests as req
-        mock_post.side_effect = req.ConnectionError("timeout")
+    def test_returns_false_on_network_error(self, mock_post, payload_factory):
+        mock_post.side_effect = requests.ConnectionError("timeout")
         config = EscalationConfig(
             enabled=True,
             webhook_url="https://hooks.slack.com/test",
         )
-        payload = EscalationPayload(
-            pr_url="url",
-            pr_title="PR",
-            pr_author="dev",
-            repo="org/repo",
-            pr_number=1,
-            confidence_score=0.3,
-            confidence_level="low",
-            review_summary="Summary",
-            escalation_reason="Reason",
-        )
+        payload = payload_factory()
 
         assert send_webhook(payload, config) is False
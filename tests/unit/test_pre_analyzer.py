@@ -1,7 +1,7 @@
 """Unit tests for pre-analyzer."""
 
 import pytest
-from unittest.mock import Mock
+from types import SimpleNamespace
 
 from pr_review_agent.analysis.pre_analyzer import (
     PRType,
@@ -16,52 +16,58 @@ from pr_review_agent.analysis.pre_analyzer import (
     analyze_pr,
 )
 
+pytestmark = pytest.mark.xdist_group("pre_analyzer")
 
-class TestCategorizeFiles:
-    """Test file categorization."""
-
-    def test_categorizes_test_files(self):
-        files = ["tests/test_main.py", "src/main.py"]
-        result = categorize_files(files)
-
-        assert "tests/test_main.py" in result["test"]
-        assert "src/main.py" in result["core"]
-
-    def test_categorizes_spec_files_as_test(self):
-        files = ["spec/feature_spec.py", "tests/unit_spec.py"]
-        result = categorize_files(files)
-
-        assert len(result["test"]) == 2
-
-    def test_categorizes_config_files(self):
-        files = ["config.yaml", ".env", "settings.json", "pyproject.toml", "config.ini"]
-        result = categorize_files(files)
-
-        assert len(result["config"]) == 5
-
-    def test_categorizes_security_files(self):
-        files = ["src/auth.py", "lib/crypto.py", "utils/password.py", "token_handler.py"]
-        result = categorize_files(files)
+_HIGH_COMPLEXITY_FILES = ("src/a.py", "src/b.py", *(f"src/f{i}.py" for i in range(10)))
 
-        assert len(result["security"]) == 4
+_CATEGORIES = ("security", "api", "core", "test", "docs", "config", "ui")
 
-    def test_categorizes_docs(self):
-        files = ["README.md", "docs/guide.rst", "CHANGELOG.txt"]
-        result = categorize_files(files)
 
-        assert len(result["docs"]) == 3
+def _patterns(**kw):
+    """Build a file_patterns dict with every category present, empty unless given."""
+    d = {k: [] for k in _CATEGORIES}
+    d.update({k: list(v) for k, v in kw.items()})
+    return d
 
-    def test_categorizes_api_files(self):
-        files = ["src/api/routes.py", "endpoints/users.py", "handlers/request.py"]
-        result = categorize_files(files)
 
-        assert len(result["api"]) == 3
-
-    def test_categorizes_ui_files(self):
-        files = ["components/Button.tsx", "pages/Home.vue", "views/Dashboard.js"]
-        result = categorize_files(files)
+class TestCategorizeFiles:
+    """Test file categorization."""
 
-        assert len(result["ui"]) == 3
+    @pytest.mark.parametrize(
+        "files,category,expected_count",
+        [
+            pytest.param(["tests/test_main.py", "src/main.py"], "test", 1, id="test"),
+            pytest.param(["tests/test_main.py", "src/main.py"], "core", 1, id="core"),
+            pytest.param(["spec/feature_spec.py", "tests/unit_spec.py"], "test", 2, id="spec"),
+            pytest.param(
+                ["config.yaml", ".env", "settings.json", "pyproject.toml", "config.ini"],
+                "config",
+                5,
+                id="config",
+            ),
+            pytest.param(
+                ["src/auth.py", "lib/crypto.py", "utils/password.py", "token_handler.py"],
+                "security",
+                4,
+                id="security",
+            ),
+            pytest.param(["README.md", "docs/guide.rst", "CHANGELOG.txt"], "docs", 3, id="docs"),
+            pytest.param(
+                ["src/api/routes.py", "endpoints/users.py", "handlers/request.py"],
+                "api",
+                3,
+                id="api",
+            ),
+            pytest.param(
+                ["components/Button.tsx", "pages/Home.vue", "views/Dashboard.js"],
+                "ui",
+                3,
+                id="ui",
+            ),
+        ],
+    )
+    def test_categorizes(self, files, category, expected_count):
+        assert len(categorize_files(files)[category]) == expected_count
 
     def test_empty_files_list(self):
         result = categorize_files([])
@@ -72,216 +78,132 @@ class TestCategorizeFiles:
 class TestInferPRType:
     """Test PR type inference."""
 
-    def test_bugfix_from_title(self):
-        assert infer_pr_type("fix: resolve login issue", "", {}) == PRType.BUGFIX
-        assert infer_pr_type("bug: null pointer exception", "", {}) == PRType.BUGFIX
-        assert infer_pr_type("patch: memory leak", "", {}) == PRType.BUGFIX
-        assert infer_pr_type("Issue #123 fix", "", {}) == PRType.BUGFIX
-
-    def test_feature_from_title(self):
-        assert infer_pr_type("feat: add dark mode", "", {}) == PRType.FEATURE
-        assert infer_pr_type("implement user dashboard", "", {}) == PRType.FEATURE
-        assert infer_pr_type("Add new payment method", "", {}) == PRType.FEATURE
-        assert infer_pr_type("New feature: notifications", "", {}) == PRType.FEATURE
-
-    def test_refactor_from_title(self):
-        assert infer_pr_type("refactor: cleanup auth module", "", {}) == PRType.REFACTOR
-        assert infer_pr_type("Reorganize project structure", "", {}) == PRType.REFACTOR
-
-    def test_security_from_title(self):
-        assert infer_pr_type("security: patch CVE-2024-1234", "", {}) == PRType.SECURITY
-        assert infer_pr_type("Fix vulnerability in auth", "", {}) == PRType.SECURITY
-
-    def test_test_from_title(self):
-        assert infer_pr_type("test: add unit tests", "", {}) == PRType.TEST
-        assert infer_pr_type("Improve coverage", "", {}) == PRType.TEST
-
-    def test_docs_from_title(self):
-        assert infer_pr_type("doc: update README", "", {}) == PRType.DOCS
-        assert infer_pr_type("Update comments", "", {}) == PRType.DOCS
-
-    def test_dependency_from_title(self):
-        assert infer_pr_type("dep: upgrade lodash", "", {}) == PRType.DEPENDENCY
-        assert infer_pr_type("Bump version to 2.0", "", {}) == PRType.DEPENDENCY
-        assert infer_pr_type("Upgrade to latest version", "", {}) == PRType.DEPENDENCY
+    @pytest.mark.parametrize(
+        "title,expected",
+        [
+            ("fix: resolve login issue", PRType.BUGFIX),
+            ("bug: null pointer exception", PRType.BUGFIX),
+            ("patch: memory leak", PRType.BUGFIX),
+            ("Issue #123 fix", PRType.BUGFIX),
+            ("feat: add dark mode", PRType.FEATURE),
+            ("implement user dashboard", PRType.FEATURE),
+            ("Add new payment method", PRType.FEATURE),
+            ("New feature: notifications", PRType.FEATURE),
+            ("refactor: cleanup auth module", PRType.REFACTOR),
+            ("Reorganize project structure", PRType.REFACTOR),
+            ("security: patch CVE-2024-1234", PRType.SECURITY),
+            ("Fix vulnerability in auth", PRType.SECURITY),
+            ("test: add unit tests", PRType.TEST),
+            ("Improve coverage", PRType.TEST),
+            ("doc: update README", PRType.DOCS),
+            ("Update comments", PRType.DOCS),
+            ("dep: upgrade lodash", PRType.DEPENDENCY),
+            ("Bump version to 2.0", PRType.DEPENDENCY),
+            ("Upgrade to latest version", PRType.DEPENDENCY),
+        ],
+    )
+    def test_infer_pr_type_from_title(self, title, expected):
+        assert infer_pr_type(title, "", {}) == expected
 
     def test_test_from_file_patterns(self):
-        file_patterns = {
-            "test": ["test_a.py", "test_b.py", "test_c.py"],
-            "core": ["main.py"],
-            "config": [],
-            "docs": [],
-            "security": [],
-            "api": [],
-            "ui": [],
-        }
+        file_patterns = _patterns(test=["test_a.py", "test_b.py", "test_c.py"], core=["main.py"])
         assert infer_pr_type("update tests", "", file_patterns) == PRType.TEST
 
     def test_docs_from_file_patterns(self):
-        file_patterns = {
-            "docs": ["README.md", "CONTRIBUTING.md"],
-            "core": [],
-            "test": [],
-            "config": [],
-            "security": [],
-            "api": [],
-            "ui": [],
-        }
+        file_patterns = _patterns(docs=["README.md", "CONTRIBUTING.md"])
         assert infer_pr_type("update documentation", "", file_patterns) == PRType.DOCS
 
     def test_security_from_file_patterns(self):
-        file_patterns = {
-            "security": ["auth.py"],
-            "core": [],
-            "test": [],
-            "config": [],
-            "docs": [],
-            "api": [],
-            "ui": [],
-        }
+        file_patterns = _patterns(security=["auth.py"])
         # Security files should flag as security PR
         assert infer_pr_type("some update", "", file_patterns) == PRType.SECURITY
 
     def test_config_from_file_patterns(self):
-        file_patterns = {
-            "config": ["config.yaml", ".env"],
-            "core": [],
-            "test": [],
-            "docs": [],
-            "security": [],
-            "api": [],
-            "ui": [],
-        }
+        file_patterns = _patterns(config=["config.yaml", ".env"])
         assert infer_pr_type("update config", "", file_patterns) == PRType.CONFIG
 
     def test_defaults_to_feature(self):
-        file_patterns = {
-            "core": ["main.py"],
-            "test": [],
-            "config": [],
-            "docs": [],
-            "security": [],
-            "api": [],
-            "ui": [],
-        }
+        file_patterns = _patterns(core=["main.py"])
         assert infer_pr_type("some changes", "", file_patterns) == PRType.FEATURE
 
 
 class TestAssessRisk:
     """Test risk assessment."""
 
-    def test_critical_for_security_files(self):
-        file_patterns = {
-            "security": ["auth.py"],
-            "api": [],
-            "core": [],
-            "test": [],
-            "docs": [],
-            "config": [],
-            "ui": [],
-        }
-        pr = Mock(lines_changed=10)
-
-        assert assess_risk(pr, file_patterns) == RiskLevel.CRITICAL
-
-    def test_high_for_large_prs(self):
-        file_patterns = {
-            "security": [],
-            "api": [],
-            "core": ["a.py"],
-            "test": [],
-            "docs": [],
-            "config": [],
-            "ui": [],
-        }
-        pr = Mock(lines_changed=400)
-
-        assert assess_risk(pr, file_patterns) == RiskLevel.HIGH
-
-    def test_high_for_many_api_changes(self):
-        file_patterns = {
-            "security": [],
-            "api": ["a.py", "b.py", "c.py", "d.py"],
-            "core": [],
-            "test": [],
-            "docs": [],
-            "config": [],
-            "ui": [],
-        }
-        pr = Mock(lines_changed=50)
-
-        assert assess_risk(pr, file_patterns) == RiskLevel.HIGH
-
-    def test_medium_for_core_changes(self):
-        file_patterns = {
-            "security": [],
-            "api": [],
-            "core": ["a.py", "b.py", "c.py", "d.py", "e.py", "f.py"],
-            "test": [],
-            "docs": [],
-            "config": [],
-            "ui": [],
-        }
-        pr = Mock(lines_changed=100)
-
-        assert assess_risk(pr, file_patterns) == RiskLevel.MEDIUM
-
-    def test_low_for_test_only(self):
-        file_patterns = {
-            "test": ["test_a.py", "test_b.py"],
-            "core": [],
-            "security": [],
-            "api": [],
-            "docs": [],
-            "config": [],
-            "ui": [],
-        }
-        pr = Mock(lines_changed=50)
-
-        assert assess_risk(pr, file_patterns) == RiskLevel.LOW
-
-    def test_low_for_docs_only(self):
-        file_patterns = {
-            "docs": ["README.md", "CONTRIBUTING.md"],
-            "core": [],
-            "test": [],
-            "security": [],
-            "api": [],
-            "config": [],
-            "ui": [],
-        }
-        pr = Mock(lines_changed=50)
-
-        assert assess_risk(pr, file_patterns) == RiskLevel.LOW
+    @pytest.mark.parametrize(
+        "file_patterns,lines_changed,expected",
+        [
+            pytest.param(
+                _patterns(security=["auth.py"]),
+                10,
+                RiskLevel.CRITICAL,
+                id="critical_security",
+            ),
+            pytest.param(
+                _patterns(core=["a.py"]),
+                400,
+                RiskLevel.HIGH,
+                id="high_large_pr",
+            ),
+            pytest.param(
+                _patterns(api=["a.py", "b.py", "c.py", "d.py"]),
+                50,
+                RiskLevel.HIGH,
+                id="high_many_api",
+            ),
+            pytest.param(
+                _patterns(core=["a.py", "b.py", "c.py", "d.py", "e.py", "f.py"]),
+                100,
+                RiskLevel.MEDIUM,
+                id="medium_core",
+            ),
+            pytest.param(
+                _patterns(test=["test_a.py", "test_b.py"]),
+                50,
+                RiskLevel.LOW,
+                id="low_test_only",
+            ),
+            pytest.param(
+                _patterns(docs=["README.md", "CONTRIBUTING.md"]),
+                50,
+                RiskLevel.LOW,
+                id="low_docs_only",
+            ),
+        ],
+    )
+    def test_assess_risk(self, file_patterns, lines_changed, expected):
+        pr = SimpleNamespace(lines_changed=lines_changed)
+
+        assert assess_risk(pr, file_patterns) == expected
 
 
 class TestAssessComplexity:
     """Test complexity assessment."""
 
     def test_high_complexity_large_lines(self):
-        pr = Mock(lines_changed=250, files_changed=3)
+        pr = SimpleNamespace(lines_changed=250, files_changed=3)
         assert assess_complexity(pr) == "high"
 
     def test_high_complexity_many_files(self):
-        pr = Mock(lines_changed=50, files_changed=15)
+        pr = SimpleNamespace(lines_changed=50, files_changed=15)
         assert assess_complexity(pr) == "high"
 
     def test_medium_complexity(self):
-        pr = Mock(lines_changed=75, files_changed=4)
+        pr = SimpleNamespace(lines_changed=75, files_changed=4)
         assert assess_complexity(pr) == "medium"
 
     def test_low_complexity(self):
-        pr = Mock(lines_changed=30, files_changed=2)
+        pr = SimpleNamespace(lines_changed=30, files_changed=2)
         assert assess_complexity(pr) == "low"
 
     def test_boundary_high_complexity_lines(self):
         # Exactly at boundary
-        pr = Mock(lines_changed=200, files_changed=3)
+        pr = SimpleNamespace(lines_changed=200, files_changed=3)
         assert assess_complexity(pr) == "high"
 
     def test_boundary_medium_complexity(self):
         # Exactly at boundary
-        pr = Mock(lines_changed=50, files_changed=5)
+        pr = SimpleNamespace(lines_changed=50, files_changed=5)
         assert assess_complexity(pr) == "medium"
 
 
@@ -358,7 +280,7 @@ class TestAnalyzePR:
     """Test full PR analysis."""
 
     def test_returns_complete_analysis(self):
-        pr = Mock(
+        pr = SimpleNamespace(
             title="feat: add user authentication",
             description="Implements OAuth2 login",
             files_changed=["src/auth.py", "tests/test_auth.py"],
@@ -375,7 +297,7 @@ class TestAnalyzePR:
         assert analysis.suggested_model is not None
 
     def test_small_feature_uses_haiku(self):
-        pr = Mock(
+        pr = SimpleNamespace(
             title="feat: add helper function",
             description="Small utility",
             files_changed=["src/utils.py"],
@@ -387,7 +309,7 @@ class TestAnalyzePR:
         assert "haiku" in analysis.suggested_model.lower()
 
     def test_security_pr_uses_sonnet(self):
-        pr = Mock(
+        pr = SimpleNamespace(
             title="security: fix auth vulnerability",
             description="Critical fix",
             files_changed=["src/auth.py"],
@@ -399,10 +321,10 @@ class TestAnalyzePR:
         assert "sonnet" in analysis.suggested_model.lower()
 
     def test_high_complexity_uses_sonnet(self):
-        pr = Mock(
+        pr = SimpleNamespace(
             title="feat: major refactor",
             description="Large changes",
-            files_changed=["src/a.py", "src/b.py"] + [f"src/f{i}.py" for i in range(10)],
+            files_changed=list(_HIGH_COMPLEXITY_FILES),
             lines_changed=300,
         )
 
@@ -411,7 +333,7 @@ class TestAnalyzePR:
         assert "sonnet" in analysis.suggested_model.lower()
 
     def test_test_only_pr_analysis(self):
-        pr = Mock(
+        pr = SimpleNamespace(
             title="test: add unit tests",
             description="Improve coverage",
             files_changed=["tests/test_main.py", "tests/test_utils.py"],
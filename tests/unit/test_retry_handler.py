@@ -1,30 +1,128 @@
 """Unit tests for retry handler."""
 
+import dataclasses
+import threading
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from types import SimpleNamespace
+
+import anthropic
 import pytest
-from unittest.mock import Mock, patch, MagicMock
 
 from pr_review_agent.execution.retry_handler import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    FailureType,
     RetryContext,
+    RetryExhaustedError,
     RetryStrategy,
-    FailureType,
-    get_backoff_seconds,
     adapt_strategy,
+    get_backoff_seconds,
+    get_circuit_breaker,
+    get_retry_after_seconds,
     retry_with_adaptation,
 )
 
+pytestmark = pytest.mark.execution_retry
+
+
+def _response(status_code, headers=None):
+    """Just enough of an httpx.Response for anthropic's error constructors."""
+    return SimpleNamespace(status_code=status_code, headers=headers or {}, request=None)
+
+
+# Fresh instances per raise: raising mutates __traceback__/__context__, which
+# would otherwise carry over from one test to the next.
+def _rate_limit_err():
+    return anthropic.RateLimitError("rate limited", response=_response(429), body={})
+
+
+def _context_err():
+    return anthropic.BadRequestError("context length exceeded", response=_response(400), body={})
+
+
+def _auth_err():
+    return anthropic.AuthenticationError("invalid api key", response=_response(401), body={})
+
+
+class _Scripted:
+    """Callable stub that returns, or raises, the given outcomes in order."""
+
+    def __init__(self, *outcomes):
+        self._outcomes = iter(outcomes)
+        self.calls = 0
+
+    def __call__(self, *args):
+        self.calls += 1
+        outcome = next(self._outcomes)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
 
 class TestBackoff:
     """Test exponential backoff calculation."""
 
-    def test_backoff_increases_exponentially(self):
-        assert get_backoff_seconds(0) == 1
-        assert get_backoff_seconds(1) == 2
-        assert get_backoff_seconds(2) == 4
-        assert get_backoff_seconds(3) == 8
+    @pytest.mark.parametrize("attempt", [*range(15), 100])
+    def test_backoff_curve(self, attempt):
+        """Doubles from 1s and caps at 30s, with the cap kicking in at attempt 5."""
+        expected = min(2.0**attempt, 30.0)
+
+        # rng=0.5 puts the jitter factor at exactly 1.0
+        assert get_backoff_seconds(attempt, rng=lambda: 0.5) == expected
+        assert get_backoff_seconds(attempt, rng=lambda: 0.0) == pytest.approx(expected * 0.8)
+        assert get_backoff_seconds(attempt, rng=lambda: 1.0) == pytest.approx(expected * 1.2)
+
+    def test_backoff_has_jitter_range(self):
+        samples = [get_backoff_seconds(3) for _ in range(1000)]
+
+        assert all(8 * 0.8 <= s <= 8 * 1.2 for s in samples)
+        # The real RNG should spread values across most of the window
+        assert min(samples) < 8 * 0.85
+        assert max(samples) > 8 * 1.15
+
+
+class TestRetryAfter:
+    """Test Retry-After header parsing."""
+
+    @staticmethod
+    def _rate_limit_error(headers):
+        return anthropic.RateLimitError("rate limited", response=_response(429, headers), body={})
+
+    def test_parses_delta_seconds(self):
+        assert get_retry_after_seconds(self._rate_limit_error({"retry-after": "7"})) == 7.0
+
+    def test_parses_http_date(self):
+        retry_at = datetime.now(UTC) + timedelta(seconds=45)
+        error = self._rate_limit_error({"retry-after": format_datetime(retry_at, usegmt=True)})
 
-    def test_backoff_caps_at_30_seconds(self):
-        assert get_backoff_seconds(10) == 30
-        assert get_backoff_seconds(100) == 30
+        assert 30 < get_retry_after_seconds(error) <= 45
+
+    def test_parses_http_date_with_unknown_zone(self):
+        """RFC 5322 '-0000' dates parse to naive datetimes; treat them as UTC."""
+        retry_at = datetime.now(UTC) + timedelta(seconds=45)
+        header = format_datetime(retry_at.replace(tzinfo=None))
+        assert header.endswith("-0000")
+
+        error = self._rate_limit_error({"retry-after": header})
+
+        assert 30 < get_retry_after_seconds(error) <= 45
+
+    def test_missing_or_invalid_header_returns_none(self):
+        assert get_retry_after_seconds(self._rate_limit_error({})) is None
+        assert get_retry_after_seconds(self._rate_limit_error({"retry-after": "soon"})) is None
+
+    @pytest.mark.parametrize("header", ["inf", "-inf", "nan", "1e400"])
+    def test_non_finite_header_returns_none(self, header):
+        assert get_retry_after_seconds(self._rate_limit_error({"retry-after": header})) is None
+
+    @pytest.mark.parametrize("header", ["86400", "1e300"])
+    def test_huge_header_is_capped(self, header):
+        error = self._rate_limit_error({"retry-after": header})
+
+        assert get_retry_after_seconds(error) == 60
+        assert get_retry_after_seconds(error, cap=5) == 5
 
 
 class TestRetryContext:
@@ -34,14 +132,23 @@ class TestRetryContext:
         context = RetryContext()
         assert context.attempt == 0
         assert context.max_attempts == 3
-        assert context.failures == []
+        assert context.failures == frozenset()
 
     def test_custom_initialization(self):
-        context = RetryContext(attempt=2, max_attempts=5, failures=[FailureType.RATE_LIMIT])
+        context = RetryContext(
+            attempt=2, max_attempts=5, failures=frozenset({FailureType.RATE_LIMIT})
+        )
         assert context.attempt == 2
         assert context.max_attempts == 5
         assert FailureType.RATE_LIMIT in context.failures
 
+    def test_context_is_frozen_and_hashable(self):
+        context = RetryContext(failures=frozenset({FailureType.RATE_LIMIT}))
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            context.attempt = 1
+        assert hash(context) == hash(RetryContext(failures=frozenset({FailureType.RATE_LIMIT})))
+
 
 class TestRetryStrategy:
     """Test RetryStrategy dataclass."""
@@ -58,47 +165,55 @@ class TestRetryStrategy:
         assert strategy.summarize_diff is False
         assert strategy.chunk_files is False
 
+    def test_strategy_is_hashable(self):
+        assert hash(RetryStrategy("m", 4096, 0.0)) == hash(RetryStrategy("m", 4096, 0.0))
+
 
 class TestAdaptStrategy:
     """Test strategy adaptation based on failures."""
 
     def test_no_failures_returns_base_strategy(self):
-        context = RetryContext(attempt=0, failures=[])
+        context = RetryContext(attempt=0, failures=frozenset())
         strategy = adapt_strategy(context, "claude-sonnet-4-20250514")
 
         assert strategy.model == "claude-sonnet-4-20250514"
         assert strategy.summarize_diff is False
         assert strategy.chunk_files is False
 
+    def test_base_strategy_is_singleton(self):
+        model = "claude-sonnet-4-20250514"
+
+        assert adapt_strategy(RetryContext(), model) is adapt_strategy(RetryContext(), model)
+
     def test_context_too_long_enables_summarization(self):
-        context = RetryContext(attempt=1, failures=[FailureType.CONTEXT_TOO_LONG])
+        context = RetryContext(attempt=1, failures=frozenset({FailureType.CONTEXT_TOO_LONG}))
         strategy = adapt_strategy(context, "claude-sonnet-4-20250514")
 
         assert strategy.summarize_diff is True
         assert strategy.chunk_files is True
 
     def test_rate_limit_falls_back_to_haiku(self):
-        context = RetryContext(attempt=1, failures=[FailureType.RATE_LIMIT])
+        context = RetryContext(attempt=1, failures=frozenset({FailureType.RATE_LIMIT}))
         strategy = adapt_strategy(context, "claude-sonnet-4-20250514")
 
         assert strategy.model == "claude-haiku-4-5-20251001"
 
     def test_rate_limit_keeps_haiku_if_already_haiku(self):
         """If already using Haiku, don't change model on rate limit."""
-        context = RetryContext(attempt=1, failures=[FailureType.RATE_LIMIT])
+        context = RetryContext(attempt=1, failures=frozenset({FailureType.RATE_LIMIT}))
         strategy = adapt_strategy(context, "claude-haiku-4-5-20251001")
 
         assert strategy.model == "claude-haiku-4-5-20251001"
 
     def test_low_quality_increases_temperature(self):
-        context = RetryContext(attempt=1, failures=[FailureType.LOW_QUALITY_RESPONSE])
+        context = RetryContext(attempt=1, failures=frozenset({FailureType.LOW_QUALITY_RESPONSE}))
         strategy = adapt_strategy(context, "claude-sonnet-4-20250514")
 
         assert strategy.temperature == 0.3
 
     def test_multiple_failures_compound(self):
         context = RetryContext(
-            attempt=2, failures=[FailureType.RATE_LIMIT, FailureType.CONTEXT_TOO_LONG]
+            attempt=2, failures=frozenset({FailureType.RATE_LIMIT, FailureType.CONTEXT_TOO_LONG})
         )
         strategy = adapt_strategy(context, "claude-sonnet-4-20250514")
 
@@ -107,81 +222,122 @@ class TestAdaptStrategy:
 
     def test_api_error_does_not_change_strategy(self):
         """API errors should retry with same strategy."""
-        context = RetryContext(attempt=1, failures=[FailureType.API_ERROR])
+        context = RetryContext(attempt=1, failures=frozenset({FailureType.API_ERROR}))
         strategy = adapt_strategy(context, "claude-sonnet-4-20250514")
 
         assert strategy.model == "claude-sonnet-4-20250514"
         assert strategy.summarize_diff is False
         assert strategy.temperature == 0.0
 
+    def test_unknown_failure_type_is_noop(self):
+        """Failure types without a mutator retry with the base strategy."""
+        context = RetryContext(attempt=1, failures=frozenset({FailureType.TIMEOUT}))
+        strategy = adapt_strategy(context, "claude-sonnet-4-20250514")
 
-class TestRetryWithAdaptation:
-    """Test the main retry function."""
-
-    def test_success_on_first_attempt(self):
-        operation = Mock(return_value="success")
+        assert strategy == RetryStrategy("claude-sonnet-4-20250514", 4096, 0.0)
 
-        result = retry_with_adaptation(
-            operation=operation, base_model="claude-sonnet-4-20250514", max_attempts=3
+    def test_adapt_strategy_does_not_mutate_context(self):
+        """Memoization relies on the context being left exactly as passed in."""
+        context = RetryContext(
+            attempt=1, failures=frozenset({FailureType.RATE_LIMIT, FailureType.CONTEXT_TOO_LONG})
         )
+        snapshot = dataclasses.astuple(context)
 
-        assert result.result == "success"
-        assert operation.call_count == 1
+        adapt_strategy(context, "claude-sonnet-4-20250514")
 
-    def test_retries_on_rate_limit(self):
-        """Test that rate limit errors trigger retry."""
-        import anthropic
+        assert dataclasses.astuple(context) == snapshot
 
-        # Create mock rate limit error
-        mock_response = Mock()
-        mock_response.status_code = 429
-        rate_limit_error = anthropic.RateLimitError(
-            "rate limited", response=mock_response, body={}
+    def test_adapt_strategy_is_memoized(self):
+        """Same failure set and model hands back the cached strategy instance."""
+        failures = frozenset({FailureType.RATE_LIMIT, FailureType.API_ERROR})
+        first = RetryContext(attempt=1, failures=failures)
+        later = RetryContext(attempt=2, failures=failures)
+
+        assert adapt_strategy(first, "claude-sonnet-4-20250514") is adapt_strategy(
+            later, "claude-sonnet-4-20250514"
         )
 
-        operation = Mock(side_effect=[rate_limit_error, "success"])
 
-        with patch("time.sleep"):  # Don't actually sleep in tests
-            result = retry_with_adaptation(
-                operation=operation, base_model="claude-sonnet-4-20250514", max_attempts=3
-            )
+class TestRetryWithAdaptation:
+    """Test the main retry function."""
 
-        assert result.result == "success"
-        assert operation.call_count == 2
+    @pytest.fixture
+    def sleep_calls(self):
+        """Delays the handler asked for; pass ``sleep=sleep_calls.append``."""
+        return []
 
-    def test_retries_on_context_too_long(self):
-        """Test that context length errors trigger retry with summarization."""
-        import anthropic
+    def test_success_on_first_attempt(self):
+        operation = _Scripted("success")
 
-        mock_response = Mock()
-        mock_response.status_code = 400
-        context_error = anthropic.BadRequestError(
-            "context length exceeded", response=mock_response, body={}
+        result = retry_with_adaptation(
+            operation=operation, base_model="claude-sonnet-4-20250514", max_attempts=3
         )
 
+        assert result.result == "success"
+        assert operation.calls == 1
+
+    @pytest.mark.parametrize(
+        "make_error,mutates",
+        [
+            pytest.param(_rate_limit_err, "model", id="rate_limit"),
+            pytest.param(_context_err, "summarize_diff", id="context_too_long"),
+        ],
+    )
+    def test_retryable_error_retries_with_adapted_strategy(
+        self, make_error, mutates, sleep_calls
+    ):
+        """Retryable errors retry once with an adapted strategy."""
         strategies_used = []
 
-        def track_strategy(strategy):
+        def operation(strategy):
             strategies_used.append(strategy)
-            if len(strategies_used) < 2:
-                raise context_error
+            if len(strategies_used) == 1:
+                raise make_error()
             return "success"
 
-        with patch("time.sleep"):
-            result = retry_with_adaptation(
-                operation=track_strategy,
+        result = retry_with_adaptation(
+            operation=operation,
+            base_model="claude-sonnet-4-20250514",
+            max_attempts=3,
+            sleep=sleep_calls.append,
+        )
+
+        assert result.result == "success"
+        first, second = strategies_used
+        assert getattr(first, mutates) != getattr(second, mutates)
+
+    @pytest.mark.parametrize(
+        "make_error",
+        [
+            pytest.param(_auth_err, id="auth"),
+            pytest.param(
+                lambda: anthropic.BadRequestError(
+                    "invalid temperature", response=_response(400), body={}
+                ),
+                id="bad_request",
+            ),
+        ],
+    )
+    def test_non_retryable_error_propagates(self, make_error, sleep_calls):
+        """Auth and non-context bad requests are raised on the first attempt."""
+        error = make_error()
+        operation = _Scripted(error)
+
+        with pytest.raises(type(error)) as exc_info:
+            retry_with_adaptation(
+                operation=operation,
                 base_model="claude-sonnet-4-20250514",
                 max_attempts=3,
+                sleep=sleep_calls.append,
             )
 
-        assert result.result == "success"
-        assert len(strategies_used) == 2
-        # Second strategy should have summarize_diff enabled
-        assert strategies_used[1].summarize_diff is True
+        assert exc_info.value is error
+        assert operation.calls == 1
+        assert sleep_calls == []
 
     def test_retries_on_validation_failure(self):
-        operation = Mock(side_effect=["bad", "bad", "good"])
-        validator = Mock(side_effect=[False, False, True])
+        operation = _Scripted("bad", "bad", "good")
+        validator = _Scripted(False, False, True)
 
         result = retry_with_adaptation(
             operation=operation,
@@ -191,76 +347,56 @@ class TestRetryWithAdaptation:
         )
 
         assert result.result == "good"
-        assert operation.call_count == 3
-
-    def test_raises_after_max_attempts(self):
-        import anthropic
-
-        mock_response = Mock()
-        mock_response.status_code = 429
-        rate_limit_error = anthropic.RateLimitError(
-            "rate limited", response=mock_response, body={}
-        )
+        assert operation.calls == 3
 
-        operation = Mock(side_effect=rate_limit_error)
+    def test_raises_after_max_attempts(self, sleep_calls):
+        operation = _Scripted(*(_rate_limit_err() for _ in range(3)))
 
-        with patch("time.sleep"):
-            with pytest.raises(Exception) as exc_info:
-                retry_with_adaptation(
-                    operation=operation,
-                    base_model="claude-sonnet-4-20250514",
-                    max_attempts=3,
-                )
+        with pytest.raises(RetryExhaustedError) as exc_info:
+            retry_with_adaptation(
+                operation=operation,
+                base_model="claude-sonnet-4-20250514",
+                max_attempts=3,
+                sleep=sleep_calls.append,
+            )
 
         assert "All 3 attempts failed" in str(exc_info.value)
-        assert operation.call_count == 3
+        assert operation.calls == 3
 
-    def test_raises_on_non_retryable_error(self):
-        """Non-retryable errors should propagate immediately."""
-        import anthropic
+    def test_backoff_is_applied_between_retries(self, sleep_calls):
+        """Verify exponential backoff is applied."""
+        operation = _Scripted(_rate_limit_err(), _rate_limit_err(), "success")
 
-        mock_response = Mock()
-        mock_response.status_code = 401
-        auth_error = anthropic.AuthenticationError(
-            "invalid api key", response=mock_response, body={}
+        result = retry_with_adaptation(
+            operation=operation,
+            base_model="claude-sonnet-4-20250514",
+            max_attempts=3,
+            sleep=sleep_calls.append,
         )
 
-        operation = Mock(side_effect=auth_error)
-
-        with pytest.raises(anthropic.AuthenticationError):
-            retry_with_adaptation(
-                operation=operation, base_model="claude-sonnet-4-20250514", max_attempts=3
-            )
-
-        # Should not retry auth errors
-        assert operation.call_count == 1
-
-    def test_backoff_is_applied_between_retries(self):
-        """Verify exponential backoff is applied."""
-        import anthropic
+        assert result.result == "success"
+        # Should have slept twice (after first and second failure)
+        assert len(sleep_calls) == 2
+        # Backoff should grow: ~2s then ~4s, whose +/-20% jitter ranges never overlap
+        assert sleep_calls[0] < sleep_calls[1]
 
-        mock_response = Mock()
-        mock_response.status_code = 429
+    def test_retry_after_header_overrides_backoff(self, sleep_calls):
+        """The server's Retry-After wins over the computed backoff."""
         rate_limit_error = anthropic.RateLimitError(
-            "rate limited", response=mock_response, body={}
+            "rate limited", response=_response(429, {"retry-after": "7"}), body={}
         )
 
-        operation = Mock(side_effect=[rate_limit_error, rate_limit_error, "success"])
-        sleep_calls = []
-
-        def mock_sleep(seconds):
-            sleep_calls.append(seconds)
+        operation = _Scripted(rate_limit_error, "success")
 
-        with patch("time.sleep", side_effect=mock_sleep):
-            result = retry_with_adaptation(
-                operation=operation, base_model="claude-sonnet-4-20250514", max_attempts=3
-            )
+        result = retry_with_adaptation(
+            operation=operation,
+            base_model="claude-sonnet-4-20250514",
+            max_attempts=3,
+            sleep=sleep_calls.append,
+        )
 
         assert result.result == "success"
-        # Should have slept twice (after first and second failure)
-        assert len(sleep_calls) == 2
-        # Backoff should increase (1 -> 2 seconds)
-        assert sleep_calls[0] < sleep_calls[1]
+        assert sleep_calls == [7.0]
 
     def test_strategy_passed_to_operation(self):
         """Verify the strategy is correctly passed to the operation."""
@@ -280,3 +416,195 @@ class TestRetryWithAdaptation:
         assert received_strategy is not None
         assert received_strategy.model == "claude-sonnet-4-20250514"
         assert received_strategy.max_tokens == 4096
+
+
+class TestCircuitBreaker:
+    """Test the per-model circuit breaker."""
+
+    def test_opens_after_threshold_failures(self):
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=60, clock=lambda: now[0])
+
+        for _ in range(3):
+            breaker.before_call()
+            breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker(failure_threshold=2)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_probe_after_recovery_timeout(self):
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60, clock=lambda: now[0])
+        breaker.record_failure()
+
+        now[0] = 61.0
+        assert breaker.state is CircuitState.HALF_OPEN
+        breaker.before_call()  # probe is allowed
+
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+
+        now[0] = 122.0
+        breaker.before_call()
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_allows_a_single_probe(self):
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60, clock=lambda: now[0])
+        breaker.record_failure()
+        now[0] = 61.0
+
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError, match="probe"):
+            breaker.before_call()
+
+        # An inconclusive probe frees the slot without closing the circuit
+        breaker.release()
+        assert breaker.state is CircuitState.HALF_OPEN
+        breaker.before_call()
+
+    def test_open_circuit_skips_operation(self):
+        """After 5 consecutive rate limits the next call fails fast."""
+        operation = _Scripted(*(_rate_limit_err() for _ in range(6)))
+
+        for _ in range(5):
+            with pytest.raises(RetryExhaustedError):
+                retry_with_adaptation(
+                    operation=operation,
+                    base_model="claude-haiku-4-5-20251001",
+                    max_attempts=1,
+                )
+
+        with pytest.raises(RetryExhaustedError) as exc_info:
+            retry_with_adaptation(
+                operation=operation, base_model="claude-haiku-4-5-20251001", max_attempts=1
+            )
+        assert isinstance(exc_info.value.__cause__, CircuitOpenError)
+        assert exc_info.value.attempts == []
+        assert operation.calls == 5
+
+    def test_rejected_response_does_not_reset_failures(self):
+        """Only a validated response counts as a success for the breaker."""
+        haiku = "claude-haiku-4-5-20251001"
+        for _ in range(4):
+            with pytest.raises(RetryExhaustedError):
+                retry_with_adaptation(_Scripted(_rate_limit_err()), haiku, max_attempts=1)
+
+        with pytest.raises(RetryExhaustedError):
+            retry_with_adaptation(
+                _Scripted("bad"), haiku, max_attempts=1, validator=lambda r: r == "good"
+            )
+        with pytest.raises(RetryExhaustedError):
+            retry_with_adaptation(_Scripted(_rate_limit_err()), haiku, max_attempts=1)
+
+        assert get_circuit_breaker(haiku).state is CircuitState.OPEN
+
+    def test_breaker_checked_before_backoff_keeps_attempts(self):
+        """A circuit that opens mid-retry fails fast with the attempts so far."""
+        haiku = "claude-haiku-4-5-20251001"
+        for _ in range(4):
+            with pytest.raises(RetryExhaustedError):
+                retry_with_adaptation(_Scripted(_rate_limit_err()), haiku, max_attempts=1)
+
+        server_err = anthropic.InternalServerError("boom", response=_response(500), body={})
+        operation = _Scripted(_context_err(), server_err, "unreachable")
+        sleep_calls = []
+        with pytest.raises(RetryExhaustedError) as exc_info:
+            retry_with_adaptation(operation, haiku, max_attempts=3, sleep=sleep_calls.append)
+
+        assert isinstance(exc_info.value.__cause__, CircuitOpenError)
+        assert [a.failure_type for a in exc_info.value.attempts] == [
+            "context_too_long",
+            "api_error",
+        ]
+        assert operation.calls == 2
+        # Backed off once before attempt 2; refused attempt 3 without sleeping
+        assert len(sleep_calls) == 1
+
+    @pytest.mark.parametrize(
+        "make_error,opens",
+        [
+            pytest.param(
+                lambda: anthropic.InternalServerError("boom", response=_response(500), body={}),
+                True,
+                id="5xx",
+            ),
+            pytest.param(lambda: anthropic.APIConnectionError(request=None), True, id="connection"),
+            pytest.param(lambda: anthropic.APITimeoutError(request=None), True, id="timeout"),
+            pytest.param(
+                lambda: anthropic.NotFoundError("no such model", response=_response(404), body={}),
+                False,
+                id="404",
+            ),
+            pytest.param(
+                lambda: anthropic.UnprocessableEntityError(
+                    "bad request", response=_response(422), body={}
+                ),
+                False,
+                id="422",
+            ),
+        ],
+    )
+    def test_only_upstream_failures_count(self, make_error, opens):
+        """A caller's own 4xx errors must not open the circuit for everyone."""
+        haiku = "claude-haiku-4-5-20251001"
+        for _ in range(5):
+            with pytest.raises(RetryExhaustedError):
+                retry_with_adaptation(_Scripted(make_error()), haiku, max_attempts=1)
+
+        expected = CircuitState.OPEN if opens else CircuitState.CLOSED
+        assert get_circuit_breaker(haiku).state is expected
+
+    def test_half_open_probe_is_exclusive_across_threads(self):
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60, clock=lambda: now[0])
+        breaker.record_failure()
+        now[0] = 61.0
+
+        n_threads = 8
+        barrier = threading.Barrier(n_threads)
+        admitted = []
+
+        def probe():
+            barrier.wait()
+            try:
+                breaker.before_call()
+            except CircuitOpenError:
+                return
+            admitted.append(threading.get_ident())
+
+        threads = [threading.Thread(target=probe) for _ in range(n_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(admitted) == 1
+
+    def test_registry_returns_one_breaker_per_model_across_threads(self):
+        n_threads = 8
+        barrier = threading.Barrier(n_threads)
+        seen = []
+
+        def fetch():
+            barrier.wait()
+            seen.append(get_circuit_breaker("claude-haiku-4-5-20251001"))
+
+        threads = [threading.Thread(target=fetch) for _ in range(n_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(breaker) for breaker in seen}) == 1